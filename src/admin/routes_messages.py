@@ -28,6 +28,8 @@ from typing import List, Optional
 import yaml
 from flask import Blueprint, current_app, jsonify, request
 
+from ..templates.resolver import TemplateResolver
+
 messages_bp = Blueprint("messages", __name__)
 
 logger = logging.getLogger(__name__)
@@ -139,48 +141,17 @@ def _save_plan(plan_data: dict) -> None:
 def _find_template_file(template_name: str) -> Optional[Path]:
     """
     Find a template file by name, searching all subdirectories.
-    Mirrors the logic in TemplateResolver.resolve().
+    Uses TemplateResolver.resolve() so the admin UI and ticks agree.
     Checks for encrypted (.enc) variants first, then plaintext.
     """
-    templates_dir = _templates_dir()
-    search_dirs = ["operator", "custodians", "subscribers", "public", "articles", ""]
-    extensions = [".md", ".txt", ".html"]
-
-    for subdir in search_dirs:
-        base = templates_dir / subdir if subdir else templates_dir
-        if not base.exists():
-            continue
-        for ext in extensions:
-            # Encrypted version first
-            enc_path = base / f"{template_name}{ext}.enc"
-            if enc_path.exists():
-                return enc_path
-            # Then plaintext
-            path = base / f"{template_name}{ext}"
-            if path.exists():
-                return path
-
-    return None
+    return TemplateResolver(_templates_dir()).resolve(template_name)
 
 
 def _read_template_content(path: Path) -> str:
     """
     Read a template file, decrypting if it is a .enc envelope.
     """
-    if path.suffix == ".enc":
-        from ..content.crypto import decrypt_file, get_encryption_key
-
-        key = get_encryption_key()
-        if not key:
-            raise ValueError(
-                f"Template '{path.name}' is encrypted but no "
-                f"CONTENT_ENCRYPTION_KEY is configured."
-            )
-        envelope = path.read_bytes()
-        info = decrypt_file(envelope, key)
-        return info["plaintext"].decode("utf-8")
-
-    return path.read_text(encoding="utf-8")
+    return TemplateResolver.read(path)
 
 
 def _write_template_content(
@@ -62,6 +62,7 @@ def build_site(ctx: click.Context, output: str, clean: bool, archive: bool) -> N
         state=state,
         audit_entries=audit_entries,
         clean=clean,
+        include_file_list=True,
     )
 
     click.secho(f"✓ Site built: {result['files_generated']} files", fg="green")
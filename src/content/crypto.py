@@ -56,6 +56,12 @@ Encrypted media files use a compact binary format to avoid base64 overhead:
     envelope = encrypt_content(editor_js_dict, passphrase="my-secret")
     original = decrypt_content(envelope, passphrase="my-secret")
 
+    # Many articles, one passphrase: derive the key once, then skip PBKDF2
+    salt = os.urandom(SALT_BYTES)
+    key = derive_key("my-secret", salt)
+    envelope = encrypt_with_key(editor_js_dict, key, salt)
+    original = decrypt_with_key(envelope, key)
+
     # Media files (binary)
     encrypted = encrypt_file(raw_bytes, "photo.jpg", "image/jpeg", passphrase="my-secret")
     info = decrypt_file(encrypted, passphrase="my-secret")
@@ -64,7 +70,6 @@ Encrypted media files use a compact binary format to avoid base64 overhead:
 
 from __future__ import annotations
 
-import base64
 import hashlib
 import json
 import logging
@@ -72,7 +77,19 @@ import os
 import secrets
 import struct
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+# pybase64 is an optional, API-compatible SIMD codec; it mostly pays off on
+# the ciphertext field of large articles. Without it, call binascii directly:
+# base64.b64encode/b64decode only add argument coercion on top of it.
+try:
+    from pybase64 import b64decode, b64encode
+except ImportError:
+    from binascii import a2b_base64 as b64decode
+    from binascii import b2a_base64
+
+    def b64encode(data: bytes) -> bytes:
+        return b2a_base64(data, newline=False)
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +110,14 @@ ENV_VAR = "CONTENT_ENCRYPTION_KEY"
 # Passphrase generation: 32 URL-safe characters ≈ 192 bits of entropy
 GENERATED_KEY_LENGTH = 32
 
+# Compact JSON serializer for article plaintext. json.dumps() with custom
+# separators builds a new JSONEncoder per call; this one is reused (and
+# still runs the C encoder).
+_compact_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+# Indented serializer for article files on disk (same reuse rationale).
+_indented_json = json.JSONEncoder(indent=2, ensure_ascii=False).encode
+
 # Binary envelope magic bytes: "COVAULT" + version byte
 # Used to identify encrypted media files (as opposed to JSON article envelopes)
 FILE_MAGIC = b"COVAULT\x01"  # 8 bytes: 7 ASCII + 1 version byte
@@ -184,6 +209,30 @@ def _derive_key(passphrase: str, salt: bytes) -> bytes:
     return kdf.derive(passphrase.encode("utf-8"))
 
 
+def derive_key(passphrase: str, salt: bytes) -> bytes:
+    """
+    Derive the 32-byte article key for use with encrypt_with_key() and
+    decrypt_with_key().
+
+    Args:
+        passphrase: The CONTENT_ENCRYPTION_KEY passphrase.
+        salt: 16 random bytes (e.g. ``os.urandom(SALT_BYTES)``); stored in
+            every envelope encrypted with the resulting key.
+
+    Returns:
+        32-byte derived key.
+
+    Raises:
+        ValueError: If passphrase is empty or the salt has the wrong length.
+    """
+    if not passphrase or not passphrase.strip():
+        raise ValueError("Encryption passphrase must not be empty")
+    if len(salt) != SALT_BYTES:
+        raise ValueError(f"Salt must be {SALT_BYTES} bytes")
+
+    return _derive_key(passphrase, salt)
+
+
 def encrypt_content(data: Dict[str, Any], passphrase: str) -> Dict[str, Any]:
     """
     Encrypt an Editor.js content dict into an encrypted envelope.
@@ -205,18 +254,46 @@ def encrypt_content(data: Dict[str, Any], passphrase: str) -> Dict[str, Any]:
     if not passphrase or not passphrase.strip():
         raise ValueError("Encryption passphrase must not be empty")
 
+    # Generate random salt and derive key from passphrase + salt
+    salt = os.urandom(SALT_BYTES)
+    key = _derive_key(passphrase, salt)
+
+    return encrypt_with_key(data, key, salt)
+
+
+def encrypt_with_key(data: Dict[str, Any], key: bytes, salt: bytes) -> Dict[str, Any]:
+    """
+    Encrypt an Editor.js content dict with an already-derived key.
+
+    Skips PBKDF2, so a caller encrypting several articles with one
+    passphrase can derive the key once. ``salt`` must be the salt the key
+    was derived with; it is stored in the envelope so decrypt_content()
+    can still re-derive the key from the passphrase. A fresh random IV is
+    generated for each call.
+
+    Args:
+        data: Editor.js JSON content.
+        key: 32-byte key from derive_key().
+        salt: The 16-byte salt used to derive ``key``.
+
+    Returns:
+        Envelope dict with encrypted content, ready to write as JSON.
+
+    Raises:
+        ValueError: If the key or salt has the wrong length.
+    """
+    if len(key) != KEY_BYTES:
+        raise ValueError(f"Encryption key must be {KEY_BYTES} bytes")
+    if len(salt) != SALT_BYTES:
+        raise ValueError(f"Salt must be {SALT_BYTES} bytes")
+
     from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
     # Serialize content to bytes
-    plaintext = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    plaintext = _compact_json(data).encode("utf-8")
 
-    # Generate random salt and IV
-    salt = os.urandom(SALT_BYTES)
     iv = os.urandom(IV_BYTES)
 
-    # Derive key from passphrase + salt
-    key = _derive_key(passphrase, salt)
-
     # Encrypt with AES-256-GCM
     aesgcm = AESGCM(key)
     # AESGCM.encrypt returns ciphertext + tag appended (tag is last 16 bytes)
@@ -232,10 +309,10 @@ def encrypt_content(data: Dict[str, Any], passphrase: str) -> Dict[str, Any]:
         "algorithm": ALGORITHM,
         "kdf": KDF,
         "kdf_iterations": KDF_ITERATIONS,
-        "salt": base64.b64encode(salt).decode("ascii"),
-        "iv": base64.b64encode(iv).decode("ascii"),
-        "tag": base64.b64encode(tag).decode("ascii"),
-        "ciphertext": base64.b64encode(ciphertext).decode("ascii"),
+        "salt": b64encode(salt).decode("ascii"),
+        "iv": b64encode(iv).decode("ascii"),
+        "tag": b64encode(tag).decode("ascii"),
+        "ciphertext": b64encode(ciphertext).decode("ascii"),
     }
 
 
@@ -261,11 +338,38 @@ def decrypt_content(envelope: Dict[str, Any], passphrase: str) -> Dict[str, Any]
     if not passphrase or not passphrase.strip():
         raise ValueError("Decryption passphrase must not be empty")
 
+    fields = _decode_envelope(envelope)
+
+    # Derive key from passphrase + salt
+    _iterations = envelope.get("kdf_iterations", KDF_ITERATIONS)  # noqa: F841 — reserved for future per-envelope iteration count
+    key = _derive_key(passphrase, fields[0])
+
+    return _decrypt_fields(fields, key)
+
+
+def decrypt_with_key(envelope: Dict[str, Any], key: bytes) -> Dict[str, Any]:
+    """
+    Decrypt an encrypted envelope with an already-derived key.
+
+    The key must have been derived from the passphrase and this
+    envelope's salt; see encrypt_with_key().
+
+    Raises:
+        ValueError: If the envelope is malformed or the key has the wrong length.
+        cryptography.exceptions.InvalidTag: If the key is wrong or the
+            ciphertext has been tampered with.
+    """
+    if len(key) != KEY_BYTES:
+        raise ValueError(f"Encryption key must be {KEY_BYTES} bytes")
+
+    return _decrypt_fields(_decode_envelope(envelope), key)
+
+
+def _decode_envelope(envelope: Dict[str, Any]) -> Tuple[bytes, bytes, bytes, bytes]:
+    """Validate an envelope and decode its (salt, iv, tag, ciphertext) fields."""
     if not is_encrypted(envelope):
         raise ValueError("Data is not an encrypted envelope (missing 'encrypted: true')")
 
-    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-
     # Validate envelope fields
     required = ("salt", "iv", "tag", "ciphertext")
     missing = [f for f in required if f not in envelope]
@@ -274,16 +378,21 @@ def decrypt_content(envelope: Dict[str, Any], passphrase: str) -> Dict[str, Any]
 
     # Decode base64 fields
     try:
-        salt = base64.b64decode(envelope["salt"])
-        iv = base64.b64decode(envelope["iv"])
-        tag = base64.b64decode(envelope["tag"])
-        ciphertext = base64.b64decode(envelope["ciphertext"])
+        salt = b64decode(envelope["salt"])
+        iv = b64decode(envelope["iv"])
+        tag = b64decode(envelope["tag"])
+        ciphertext = b64decode(envelope["ciphertext"])
     except Exception as e:
         raise ValueError(f"Failed to decode envelope fields: {e}") from e
 
-    # Derive key from passphrase + salt
-    _iterations = envelope.get("kdf_iterations", KDF_ITERATIONS)  # noqa: F841 — reserved for future per-envelope iteration count
-    key = _derive_key(passphrase, salt)
+    return salt, iv, tag, ciphertext
+
+
+def _decrypt_fields(fields: Tuple[bytes, bytes, bytes, bytes], key: bytes) -> Dict[str, Any]:
+    """Authenticate and decrypt decoded envelope fields, then parse the JSON."""
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    _salt, iv, tag, ciphertext = fields
 
     # Reconstruct ciphertext + tag (AESGCM expects them concatenated)
     ciphertext_and_tag = ciphertext + tag
@@ -344,11 +453,35 @@ def load_article(path: Path, passphrase: Optional[str] = None) -> Dict[str, Any]
         ValueError: If the file is encrypted but no passphrase is available.
         cryptography.exceptions.InvalidTag: If the passphrase is wrong.
     """
-    if not path.exists():
-        raise FileNotFoundError(f"Article not found: {path}")
+    # One read straight into the parser; json.loads decodes UTF-8 bytes itself
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Article not found: {path}") from None
+
+    return unwrap_article(json.loads(raw), path.name, passphrase)
+
+
+def unwrap_article(
+    data: Dict[str, Any],
+    name: str,
+    passphrase: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Return the plaintext content of an already-parsed article file.
+
+    Same as load_article() for callers that have parsed the JSON themselves,
+    so the file is not read twice.
 
-    data = json.loads(path.read_text(encoding="utf-8"))
+    Args:
+        data: Parsed article JSON (plaintext content or envelope).
+        name: File name used in error messages.
+        passphrase: Encryption passphrase. If None, reads from environment.
 
+    Raises:
+        ValueError: If the article is encrypted but no passphrase is available.
+        cryptography.exceptions.InvalidTag: If the passphrase is wrong.
+    """
     if not is_encrypted(data):
         return data
 
@@ -356,7 +489,7 @@ def load_article(path: Path, passphrase: Optional[str] = None) -> Dict[str, Any]
     key = passphrase or get_encryption_key()
     if not key:
         raise ValueError(
-            f"Article '{path.name}' is encrypted but no {ENV_VAR} is configured. "
+            f"Article '{name}' is encrypted but no {ENV_VAR} is configured. "
             f"Set {ENV_VAR} in your .env file or environment."
         )
 
@@ -398,10 +531,7 @@ def save_article(
         data = content
 
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+    path.write_bytes((_indented_json(data) + "\n").encode("utf-8"))
 
     return data
 
@@ -465,33 +595,35 @@ def encrypt_file(
 
     # Encrypt with AES-256-GCM
     aesgcm = AESGCM(key)
-    ciphertext_and_tag = aesgcm.encrypt(iv, plaintext, None)
+    ciphertext_and_tag = memoryview(aesgcm.encrypt(iv, plaintext, None))
 
-    # Split ciphertext and authentication tag
+    # Split ciphertext and authentication tag (views, no copies)
     ciphertext = ciphertext_and_tag[:-TAG_BYTES]
     tag = ciphertext_and_tag[-TAG_BYTES:]
 
-    # Build binary envelope
+    # Build binary envelope in a single join so the (possibly large)
+    # ciphertext is copied once
     # Format: MAGIC | filename_len(2) | filename | mime_len(2) | mime |
     #         sha256(32) | salt(16) | iv(12) | tag(16) | ciphertext
-    envelope = bytearray()
-    envelope.extend(FILE_MAGIC)
-    envelope.extend(struct.pack(">H", len(filename_bytes)))
-    envelope.extend(filename_bytes)
-    envelope.extend(struct.pack(">H", len(mime_bytes)))
-    envelope.extend(mime_bytes)
-    envelope.extend(plaintext_hash)
-    envelope.extend(salt)
-    envelope.extend(iv)
-    envelope.extend(tag)
-    envelope.extend(ciphertext)
+    envelope = b"".join((
+        FILE_MAGIC,
+        struct.pack(">H", len(filename_bytes)),
+        filename_bytes,
+        struct.pack(">H", len(mime_bytes)),
+        mime_bytes,
+        plaintext_hash,
+        salt,
+        iv,
+        tag,
+        ciphertext,
+    ))
 
     logger.debug(
         f"Encrypted file: {filename} ({mime_type}, "
         f"{len(plaintext)} → {len(envelope)} bytes)"
     )
 
-    return bytes(envelope)
+    return envelope
 
 
 def decrypt_file(envelope: bytes, passphrase: str) -> Dict[str, Any]:
@@ -554,16 +686,15 @@ def decrypt_file(envelope: bytes, passphrase: str) -> Dict[str, Any]:
     offset += TAG_BYTES
 
     # Remaining bytes are ciphertext
-    ciphertext = envelope[offset:]
-
-    if not ciphertext:
+    if offset >= len(envelope):
         raise ValueError("Encrypted envelope contains no ciphertext")
 
     # Derive key from passphrase + salt
     key = _derive_key(passphrase, salt)
 
-    # Reconstruct ciphertext + tag for AESGCM
-    ciphertext_and_tag = ciphertext + tag
+    # Reconstruct ciphertext + tag for AESGCM, copying the ciphertext once
+    # (straight from a view of the envelope instead of slicing it first)
+    ciphertext_and_tag = b"".join((memoryview(envelope)[offset:], tag))
 
     # Decrypt and authenticate
     aesgcm = AESGCM(key)
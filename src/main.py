@@ -56,7 +56,9 @@ def get_project_root() -> Path:
 def cli(ctx: click.Context) -> None:
     """Continuity Orchestrator — Policy-first automation system."""
     ctx.ensure_object(dict)
-    ctx.obj["root"] = get_project_root()
+    # Callers (e.g. tests) may supply the root via the context object
+    if "root" not in ctx.obj:
+        ctx.obj["root"] = get_project_root()
 
 
 @cli.command()
@@ -501,12 +501,12 @@ class ContentManager:
         if not self.content_dir.exists():
             return []
         
-        from ..content.crypto import get_encryption_key, is_encrypted, load_article
+        from ..content.crypto import decrypt_content, get_encryption_key, is_encrypted
         
         articles = []
         for path in sorted(self.content_dir.glob("*.json")):
             try:
-                raw = json.loads(path.read_text())
+                raw = json.loads(path.read_bytes())
                 encrypted = is_encrypted(raw)
                 
                 # Extract title and metadata
@@ -519,7 +519,7 @@ class ContentManager:
                     key = get_encryption_key()
                     if key:
                         try:
-                            content = load_article(path, passphrase=key)
+                            content = decrypt_content(raw, key)
                             time_val = content.get("time")
                             version = content.get("version")
                             for block in content.get("blocks", []):
@@ -555,13 +555,13 @@ class ContentManager:
         if not path.exists():
             return None
         
-        from ..content.crypto import is_encrypted, load_article
+        from ..content.crypto import is_encrypted, unwrap_article
         
-        raw = json.loads(path.read_text())
+        raw = json.loads(path.read_bytes())
         encrypted = is_encrypted(raw)
         
-        # Decrypt if needed (load_article handles this transparently)
-        content = load_article(path)
+        # Decrypt if needed, from the dict already parsed above
+        content = unwrap_article(raw, path.name)
         html = self.renderer.render(content)
         
         # Extract title
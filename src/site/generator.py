@@ -6,13 +6,19 @@ Uses templates from templates/html/*.html and templates/css/*.css
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
+import re
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from html import escape
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from jinja2 import Environment, FileSystemLoader
 
@@ -20,6 +26,39 @@ from ..models.state import State
 
 logger = logging.getLogger(__name__)
 
+# Project root (src/site/generator.py → ../../..), resolved once at import
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+_ARTICLES_DIR = _PROJECT_ROOT / "content" / "articles"
+
+# Per-build record of {relative_path: content_hash}, used for incremental builds
+BUILD_MANIFEST_NAME = ".manifest.json"
+
+# Stage styling
+_STAGE_COLORS: Dict[str, str] = {
+    "OK": "#10b981",
+    "REMIND_1": "#f59e0b",
+    "REMIND_2": "#f97316",
+    "PRE_RELEASE": "#ef4444",
+    "PARTIAL": "#8b5cf6",
+    "FULL": "#dc2626",
+}
+
+# Stage → (status_class, status_message) for the index status card
+_STAGE_STATUS: Dict[str, Tuple[str, str]] = {
+    "OK": ("status-ok", "All systems operational. No action required."),
+    "REMIND_1": ("status-warning", "Awaiting renewal. Action may be required soon."),
+    "REMIND_2": ("status-warning", "Awaiting renewal. Action may be required soon."),
+    "PRE_RELEASE": ("status-alert", "Final warning. Disclosure imminent if not renewed."),
+    "PARTIAL": ("status-partial", "Partial disclosure in progress."),
+}
+_STAGE_STATUS_DEFAULT = ("status-full", "Full disclosure active.")
+
+# Enough leading bytes to recognise an encrypted media envelope
+_MEDIA_PEEK_BYTES = 4096
+
+# Characters not allowed in archive page filenames (tick IDs come from the audit log)
+_UNSAFE_ID_CHARS_RE = re.compile(r"[^A-Za-z0-9_-]")
+
 
 class SiteGenerator:
     """
@@ -37,27 +76,67 @@ class SiteGenerator:
         self.output_dir = Path(output_dir)
         self.template_dir = template_dir or self._default_template_dir()
         
-        # Setup Jinja2 environment
+        # Setup Jinja2 environment. Templates are compiled once per generator
+        # and kept for its lifetime: no eviction, no per-lookup mtime checks.
         self.jinja_env = Environment(
             loader=FileSystemLoader(str(self.template_dir / "html")),
             autoescape=True,
+            auto_reload=False,
+            cache_size=-1,
         )
+        
+        # Incremental build bookkeeping (reset at the start of each build)
+        self._previous_hashes: Dict[str, str] = {}
+        self._output_hashes: Dict[str, str] = {}
+        self._files_written = 0
+        # Output groups are generated concurrently; guards the written counter
+        self._write_lock = threading.Lock()
+        
+        # Stylesheet (name, bytes, digest) cache, reloaded only when the
+        # source directory's (name, size, mtime) signature changes
+        self._css_cache: List[Tuple[str, bytes, str]] = []
+        self._css_signature: Optional[Tuple] = None
+        
+        # Output directories already created during the current build
+        self._created_dirs: set = set()
     
     def _default_template_dir(self) -> Path:
         """Get default template directory."""
-        return Path(__file__).parent.parent.parent / "templates"
+        return _PROJECT_ROOT / "templates"
     
     def build(
         self,
         state: State,
         audit_entries: Optional[List[Dict]] = None,
         clean: bool = True,
+        include_full_state: bool = True,
+        include_file_list: bool = False,
     ) -> Dict[str, Any]:
-        """Build the complete static site."""
+        """Build the complete static site.
+        
+        The result always carries the ``files_generated`` count; the list of
+        generated paths (``files``) is only included with
+        ``include_file_list=True``.
+        
+        ``include_full_state=False`` skips the status.html page and the
+        audit scan that only it needs; the index then omits its link.
+        
+        With ``clean=False`` the build is incremental: every output goes
+        through ``_write_if_changed``, which skips files whose content hash
+        matches the previous build's manifest, and outputs that the previous
+        build produced but this one did not are removed afterwards.
+        """
         import time
         build_start = time.time()
+        # One timestamp per build: page footers, feed, sitemap and result all agree
+        build_time = datetime.now(timezone.utc).isoformat()
         logger.info(f"Building site to {self.output_dir} (state={state.escalation.state})")
         
+        self._previous_hashes = {} if clean else self._load_build_manifest()
+        self._output_hashes = {}
+        self._files_written = 0
+        self._created_dirs = set()
+        
         if clean and self.output_dir.exists():
             # Clean contents, not the directory itself (for Docker volume compatibility)
             for item in self.output_dir.iterdir():
@@ -69,7 +148,15 @@ class SiteGenerator:
                 except (PermissionError, OSError):
                     pass  # Skip files we can't delete
         
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Build context
+        context = self._build_context(
+            state, audit_entries,
+            build_time=build_time,
+            include_full_state=include_full_state,
+        )
+        
+        # Create the whole output tree up front, once
+        self._ensure_dirs(*self._required_dirs(context, audit_entries))
         
         # Copy CSS files
         self._copy_css()
@@ -77,63 +164,215 @@ class SiteGenerator:
         # Process media files (decrypt eligible ones for this stage)
         content_stage = state.escalation.state
         media_map = self._process_media(content_stage)
-        
-        # Build context
-        context = self._build_context(state, audit_entries)
         context["_media_map"] = media_map  # Internal: used by article rendering
         
         files_generated = []
         
-        # Generate pages
-        files_generated.append(self._render_template("index.html", context))
-        files_generated.append(self._render_template("countdown.html", context))
-        files_generated.append(self._render_template("timeline.html", context))
-        files_generated.append(self._render_template("status.html", context))
-        files_generated.append(self._render_template("privacy.html", context))
-        files_generated.append(self._render_template("terms.html", context))
-        files_generated.append(self._generate_feed(context))
-        files_generated.append(self._generate_status_json(context))
-        files_generated.append(self._generate_robots_txt(context))
-        
-        # Generate articles
-        article_files = self._generate_articles(context)
+        # Articles and archive entries are independent of the core pages:
+        # generate them alongside instead of after
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            articles_future = pool.submit(self._generate_articles, context)
+            archive_future = pool.submit(self._generate_archive_entries, audit_entries, context)
+            
+            # Generate pages
+            files_generated.extend(self._generate_core_pages(context, include_full_state))
+            
+            article_files = articles_future.result()
+            archive_files = archive_future.result()
+        
         files_generated.extend(article_files)
         logger.debug(f"Generated {len(article_files)} article(s)")
-        
-        # Generate archive entries
-        if audit_entries:
-            archive_dir = self.output_dir / "archive"
-            archive_dir.mkdir(exist_ok=True)
-            for entry in audit_entries[-10:]:
-                archive_path = self._generate_archive_entry(entry, context)
-                files_generated.append(archive_path)
-            logger.debug(f"Generated {min(len(audit_entries), 10)} archive entries")
+        files_generated.extend(archive_files)
+        if archive_files:
+            logger.debug(f"Generated {len(archive_files)} archive entries")
         
         # Generate sitemap.xml
         sitemap_path = self._generate_sitemap(context)
         if sitemap_path:
             files_generated.append(sitemap_path)
         
+        self._prune_stale_outputs()
+        self._save_build_manifest()
+        
         build_ms = int((time.time() - build_start) * 1000)
-        logger.info(f"Site built: {len(files_generated)} files in {build_ms}ms")
+        logger.info(
+            f"Site built: {len(files_generated)} files in {build_ms}ms "
+            f"({self._files_written} written, "
+            f"{len(self._output_hashes) - self._files_written} unchanged)"
+        )
         
-        return {
+        result = {
             "success": True,
             "output_dir": str(self.output_dir),
             "files_generated": len(files_generated),
-            "files": [str(f) for f in files_generated],
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "files_written": self._files_written,
+            "timestamp": build_time,
         }
+        if include_file_list:
+            result["files"] = [os.fspath(f) for f in files_generated]
+        return result
+    
+    def _generate_core_pages(
+        self,
+        context: Dict[str, Any],
+        include_full_state: bool,
+    ) -> List[Path]:
+        """Generate the top-level pages, feed, status.json and robots.txt."""
+        files = [
+            self._render_template("index.html", context),
+            self._render_template("countdown.html", context),
+            self._render_template("timeline.html", context),
+        ]
+        if include_full_state:
+            files.append(self._render_template("status.html", context))
+        files.append(self._render_template("privacy.html", context))
+        files.append(self._render_template("terms.html", context))
+        files.append(self._generate_feed(context))
+        files.append(self._generate_status_json(context))
+        files.append(self._generate_robots_txt(context))
+        return files
+    
+    def _generate_archive_entries(
+        self,
+        audit_entries: Optional[List[Dict]],
+        context: Dict[str, Any],
+    ) -> List[Path]:
+        """Generate archive pages for the 10 most recent audit entries."""
+        if not audit_entries:
+            return []
+        return [self._generate_archive_entry(entry, context) for entry in audit_entries[-10:]]
+    
+    def _required_dirs(
+        self,
+        context: Dict[str, Any],
+        audit_entries: Optional[List[Dict]],
+    ) -> List[Path]:
+        """List the output directories this build will write into."""
+        dirs = [self.output_dir]
+        if (self.template_dir / "css").exists():
+            dirs.append(self.output_dir / "assets" / "css")
+        if audit_entries:
+            dirs.append(self.output_dir / "archive")
+        if context.get("visible_articles"):
+            dirs.append(self.output_dir / "articles")
+        return dirs
+    
+    def _ensure_dirs(self, *dirs: Path) -> None:
+        """Create output directories, skipping any already created this build."""
+        for d in dirs:
+            if d not in self._created_dirs:
+                d.mkdir(parents=True, exist_ok=True)
+                self._created_dirs.add(d)
+    
+    @staticmethod
+    def _content_hash(data: bytes) -> str:
+        """Hash used by the build manifest to detect changed outputs."""
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+    
+    def _write_if_changed(
+        self,
+        output_path: Path,
+        data: bytes | str,
+        digest: Optional[str] = None,
+    ) -> Path:
+        """Write an output file unless the previous build wrote identical content.
+        
+        Every generated file is funnelled through here so its hash ends up in
+        the build manifest used by the next incremental build. Callers that
+        already know the content hash can pass it as ``digest``.
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        
+        if digest is None:
+            digest = self._content_hash(data)
+        rel = output_path.relative_to(self.output_dir).as_posix()
+        self._output_hashes[rel] = digest
+        
+        if self._previous_hashes.get(rel) == digest and output_path.exists():
+            return output_path
+        
+        output_path.write_bytes(data)
+        with self._write_lock:
+            self._files_written += 1
+        return output_path
+    
+    def _copy_if_changed(self, src: Path, output_path: Path) -> Path:
+        """Copy a file verbatim unless the previous build copied the same source.
+        
+        Tracked in the build manifest by source size and mtime rather than a
+        content hash, so unchanged sources are never read. Changed ones go
+        through shutil.copyfile, which uses in-kernel copy (sendfile /
+        copy_file_range) on Linux and skips copy2's metadata syscalls.
+        """
+        st = src.stat()
+        digest = f"stat:{st.st_size}:{st.st_mtime_ns}"
+        rel = output_path.relative_to(self.output_dir).as_posix()
+        self._output_hashes[rel] = digest
+        
+        if self._previous_hashes.get(rel) == digest and output_path.exists():
+            return output_path
+        
+        shutil.copyfile(src, output_path)
+        with self._write_lock:
+            self._files_written += 1
+        return output_path
+    
+    def _load_build_manifest(self) -> Dict[str, str]:
+        """Load output hashes recorded by the previous build, if any."""
+        manifest_path = self.output_dir / BUILD_MANIFEST_NAME
+        try:
+            data = json.loads(manifest_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+    
+    def _save_build_manifest(self) -> None:
+        """Record this build's output hashes for the next incremental build."""
+        manifest_path = self.output_dir / BUILD_MANIFEST_NAME
+        manifest_path.write_bytes(
+            json.dumps(self._output_hashes, separators=(",", ":"), sort_keys=True).encode("utf-8")
+        )
+    
+    def _prune_stale_outputs(self) -> None:
+        """Remove outputs from the previous build that this build did not produce."""
+        for rel in self._previous_hashes.keys() - self._output_hashes.keys():
+            try:
+                (self.output_dir / rel).unlink(missing_ok=True)
+                logger.debug(f"Removed stale output: {rel}")
+            except OSError as e:
+                logger.warning(f"Failed to remove stale output {rel}: {e}")
     
     def _copy_css(self) -> None:
         """Copy CSS files to output assets directory."""
         css_src = self.template_dir / "css"
         css_dest = self.output_dir / "assets" / "css"
         
-        if css_src.exists():
-            css_dest.mkdir(parents=True, exist_ok=True)
-            for css_file in css_src.glob("*.css"):
-                shutil.copy(css_file, css_dest / css_file.name)
+        # Cheap stat-only signature; only re-read and re-hash on change
+        signature = self._css_source_signature(css_src)
+        if signature != self._css_signature:
+            self._css_cache = []
+            for name, _, _ in signature:
+                data = (css_src / name).read_bytes()
+                self._css_cache.append((name, data, self._content_hash(data)))
+            self._css_signature = signature
+        
+        for name, data, digest in self._css_cache:
+            self._write_if_changed(css_dest / name, data, digest=digest)
+    
+    @staticmethod
+    def _css_source_signature(css_src: Path) -> Tuple:
+        """Return sorted (name, size, mtime_ns) for the *.css files in css_src."""
+        try:
+            with os.scandir(css_src) as it:
+                return tuple(sorted(
+                    (e.name, st.st_size, st.st_mtime_ns)
+                    for e in it
+                    if e.name.endswith(".css") and e.is_file()
+                    for st in (e.stat(),)
+                ))
+        except FileNotFoundError:
+            return ()
     
     # Release tag used for large media backup
     MEDIA_RELEASE_TAG = "media-vault"
@@ -270,11 +509,12 @@ class SiteGenerator:
 
         # ── Step 3: Process each visible entry ──
         media_out = self.output_dir / "media"
-        media_out.mkdir(parents=True, exist_ok=True)
+        self._ensure_dirs(media_out)
 
         processed_count = 0
         missing_count = 0
         skipped_encrypted = 0
+        used_names: set = set()  # Names taken in this build (dir may hold old outputs)
         for entry in visible:
             file_path = manifest.enc_path(entry.id)
             if not file_path.exists():
@@ -294,33 +534,35 @@ class SiteGenerator:
                 continue
 
             try:
-                raw_data = file_path.read_bytes()
-                actually_encrypted = is_encrypted_file(raw_data)
-
-                if actually_encrypted:
-                    if not passphrase:
-                        logger.warning(
-                            f"Skipping encrypted media '{entry.id}' — no key available"
-                        )
-                        skipped_encrypted += 1
-                        continue
-
-                    result = decrypt_file(raw_data, passphrase)
-                    file_bytes = result["plaintext"]
-                else:
-                    file_bytes = raw_data
+                # The envelope header fits in the first block; plaintext
+                # media never needs to be read into memory at all
+                with open(file_path, "rb") as f:
+                    head = f.read(_MEDIA_PEEK_BYTES)
+                actually_encrypted = is_encrypted_file(head)
+
+                if actually_encrypted and not passphrase:
+                    logger.warning(
+                        f"Skipping encrypted media '{entry.id}' — no key available"
+                    )
+                    skipped_encrypted += 1
+                    continue
 
                 output_name = entry.original_name
                 output_path = media_out / output_name
 
                 # Handle filename collisions by adding media ID
-                if output_path.exists():
+                if output_name in used_names:
                     stem = output_path.stem
                     suffix = output_path.suffix
                     output_name = f"{stem}_{entry.id}{suffix}"
                     output_path = media_out / output_name
+                used_names.add(output_name)
 
-                output_path.write_bytes(file_bytes)
+                if actually_encrypted:
+                    result = decrypt_file(file_path.read_bytes(), passphrase)
+                    self._write_if_changed(output_path, result["plaintext"])
+                else:
+                    self._copy_if_changed(file_path, output_path)
 
                 # Map: media_id → relative URL from site root
                 media_map[entry.id] = f"media/{output_name}"
@@ -365,8 +607,14 @@ class SiteGenerator:
         self,
         state: State,
         audit_entries: Optional[List[Dict]] = None,
+        build_time: Optional[str] = None,
+        include_full_state: bool = True,
     ) -> Dict[str, Any]:
-        """Build template context from state."""
+        """Build template context from state.
+        
+        The status.html-only values (integration executions, raw state JSON)
+        are left empty when ``include_full_state`` is False.
+        """
         # Get GitHub repository
         github_repo = os.environ.get("GITHUB_REPOSITORY", "")
         if not github_repo:
@@ -397,46 +645,27 @@ class SiteGenerator:
         
         enabled_adapters_list = ", ".join([k for k, v in enabled_adapters.items() if v]) or "None"
         
-        # Parse integration executions from audit
-        integration_executions = []
-        for entry in (audit_entries or []):
-            if entry.get("event_type") == "action_executed":
-                integration_executions.append({
-                    "action": entry.get("action", "unknown"),
-                    "adapter": entry.get("adapter", "unknown"),
-                    "timestamp": entry.get("timestamp", ""),
-                    "success": entry.get("success", True),
-                    "error": entry.get("error"),
-                    "tick_id": entry.get("tick_id", ""),
-                })
-        
-        # Stage styling
-        stage = state.escalation.state
-        stage_colors = {
-            "OK": "#10b981",
-            "REMIND_1": "#f59e0b",
-            "REMIND_2": "#f97316",
-            "PRE_RELEASE": "#ef4444",
-            "PARTIAL": "#8b5cf6",
-            "FULL": "#dc2626",
-        }
+        # Parse the 20 most recent integration executions from audit (newest
+        # first), walking the ledger from the tail and stopping early
+        executed = (
+            entry for entry in reversed(audit_entries if include_full_state and audit_entries else [])
+            if entry.get("event_type") == "action_executed"
+        )
+        integration_executions = [
+            {
+                "action": entry.get("action", "unknown"),
+                "adapter": entry.get("adapter", "unknown"),
+                "timestamp": entry.get("timestamp", ""),
+                "success": entry.get("success", True),
+                "error": entry.get("error"),
+                "tick_id": entry.get("tick_id", ""),
+            }
+            for entry in islice(executed, 20)
+        ]
         
-        # Status class for index page
-        if stage == "OK":
-            status_class = "status-ok"
-            status_message = "All systems operational. No action required."
-        elif stage in ("REMIND_1", "REMIND_2"):
-            status_class = "status-warning"
-            status_message = "Awaiting renewal. Action may be required soon."
-        elif stage == "PRE_RELEASE":
-            status_class = "status-alert"
-            status_message = "Final warning. Disclosure imminent if not renewed."
-        elif stage == "PARTIAL":
-            status_class = "status-partial"
-            status_message = "Partial disclosure in progress."
-        else:
-            status_class = "status-full"
-            status_message = "Full disclosure active."
+        # Status class and message for index page
+        stage = state.escalation.state
+        status_class, status_message = _STAGE_STATUS.get(stage, _STAGE_STATUS_DEFAULT)
         
         # Override display if shadow mode is active (release.triggered)
         release_triggered = state.release.triggered if hasattr(state, 'release') else False
@@ -462,15 +691,20 @@ class SiteGenerator:
             
             if stage_behavior and stage_behavior.banner:
                 banner_class = stage_behavior.banner_class or "info"
-                banner_html = f'<div class="banner banner-{banner_class}">{stage_behavior.banner}</div>'
+                banner_html = (
+                    f'<div class="banner banner-{escape(banner_class)}">'
+                    f'{escape(stage_behavior.banner)}</div>'
+                )
         except Exception:
             pass
         
         context = {
             "project": state.meta.project,
+            # Pre-escaped once for the hand-built (non-Jinja) pages: feed, archive
+            "project_html": escape(state.meta.project),
             "state_id": state.meta.state_id,
             "stage": display_stage,
-            "stage_color": stage_colors.get(display_stage, "#6b7280"),
+            "stage_color": _STAGE_COLORS.get(display_stage, "#6b7280"),
             "stage_entered": state.escalation.state_entered_at_iso,
             "deadline": state.timer.deadline_iso,
             "time_to_deadline": state.timer.time_to_deadline_minutes,
@@ -479,7 +713,7 @@ class SiteGenerator:
             "armed": state.mode.armed,
             "last_updated": state.meta.updated_at_iso,
             "policy_version": state.meta.policy_version,
-            "build_time": datetime.now(timezone.utc).isoformat(),
+            "build_time": build_time or datetime.now(timezone.utc).isoformat(),
             "audit_entries": audit_entries or [],
             "github_repository": github_repo or "OWNER/REPO",
             "renewal_token_fragments": renewal_token_fragments,
@@ -488,7 +722,7 @@ class SiteGenerator:
             "enabled_adapters_list": enabled_adapters_list,
             "renewal_count": state.renewal.renewal_count if hasattr(state, 'renewal') else 0,
             "last_renewal": state.renewal.last_renewal_iso if hasattr(state, 'renewal') else None,
-            "integration_executions": list(reversed(integration_executions[-20:])),
+            "integration_executions": integration_executions,
             "status_class": status_class,
             "status_message": status_message,
             "banner_html": banner_html,
@@ -496,6 +730,7 @@ class SiteGenerator:
             "nav_articles": nav_articles,
             "visible_articles": visible_articles,
             "release_triggered": state.release.triggered if hasattr(state, 'release') else False,
+            "include_full_state": include_full_state,
             "raw_state_json": json.dumps({
                 "project": state.meta.project,
                 "stage": content_stage,
@@ -503,7 +738,7 @@ class SiteGenerator:
                 "time_to_deadline": state.timer.time_to_deadline_minutes,
                 "mode": state.mode.name,
                 "armed": state.mode.armed,
-            }, indent=2, default=str),
+            }, indent=2, default=str) if include_full_state else "",
         }
         
         return context
@@ -511,11 +746,9 @@ class SiteGenerator:
     def _render_template(self, template_name: str, context: Dict[str, Any]) -> Path:
         """Render a Jinja2 template to the output directory."""
         template = self.jinja_env.get_template(template_name)
-        html = template.render(**context)
+        html = template.render(context)
         
-        output_path = self.output_dir / template_name
-        output_path.write_text(html)
-        return output_path
+        return self._write_if_changed(self.output_dir / template_name, html)
     
     def _generate_feed(self, context: Dict[str, Any]) -> Path:
         """Generate RSS feed."""
@@ -528,20 +761,21 @@ class SiteGenerator:
         else:
             site_url = ""
         
-        items = ""
-        for entry in reversed(entries[-10:]):
-            items += f"""
+        items = "".join(
+            f"""
             <item>
-                <title>Stage: {entry.get('new_state', 'Unknown')}</title>
-                <pubDate>{entry.get('timestamp', '')}</pubDate>
-                <description>Tick {entry.get('tick_id', 'N/A')}</description>
+                <title>Stage: {escape(str(entry.get('new_state', 'Unknown')))}</title>
+                <pubDate>{escape(str(entry.get('timestamp', '')))}</pubDate>
+                <description>Tick {escape(str(entry.get('tick_id', 'N/A')))}</description>
             </item>
             """
+            for entry in islice(reversed(entries), 10)
+        )
         
         feed = f"""<?xml version="1.0" encoding="UTF-8"?>
 <rss version="2.0">
     <channel>
-        <title>{context['project']} — Continuity Status</title>
+        <title>{context['project_html']} — Continuity Status</title>
         <link>{site_url}</link>
         <description>Continuity orchestrator status updates</description>
         <lastBuildDate>{context['build_time']}</lastBuildDate>
@@ -550,9 +784,7 @@ class SiteGenerator:
 </rss>
 """
         
-        output_path = self.output_dir / "feed.xml"
-        output_path.write_text(feed)
-        return output_path
+        return self._write_if_changed(self.output_dir / "feed.xml", feed)
     
     def _generate_status_json(self, context: Dict[str, Any]) -> Path:
         """Generate status.json for auto-refresh."""
@@ -565,9 +797,10 @@ class SiteGenerator:
             "release_triggered": context.get("release_triggered", False),
         }
         
-        output_path = self.output_dir / "status.json"
-        output_path.write_text(json.dumps(status, indent=2))
-        return output_path
+        # Compact: polled by every open page every POLL_INTERVAL, never read by humans
+        return self._write_if_changed(
+            self.output_dir / "status.json", json.dumps(status, separators=(",", ":"))
+        )
     
     def _generate_robots_txt(self, context: Dict[str, Any]) -> Path:
         """Generate robots.txt allowing all crawlers."""
@@ -591,9 +824,7 @@ class SiteGenerator:
             lines.append(f"Sitemap: {sitemap_url}")
             lines.append("")
         
-        output_path = self.output_dir / "robots.txt"
-        output_path.write_text("\n".join(lines))
-        return output_path
+        return self._write_if_changed(self.output_dir / "robots.txt", "\n".join(lines))
     
     def _generate_archive_entry(
         self,
@@ -603,40 +834,26 @@ class SiteGenerator:
         """Generate an archive page for an event."""
         tick_id = entry.get("tick_id", "unknown")
         timestamp = entry.get("timestamp", "")
-        safe_id = tick_id.replace(":", "-").replace(" ", "_")
-        
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Event {tick_id}</title>
-    <link rel="stylesheet" href="../assets/css/base.css">
-    <link rel="stylesheet" href="../assets/css/status.css">
-</head>
-<body class="page-status">
-    <header>
-        <h1>Event Record</h1>
-        <a href="../timeline.html">← Timeline</a>
-    </header>
-    
-    <main>
-        <section>
-            <h2>{tick_id}</h2>
-            <p>Timestamp: {timestamp}</p>
-            <pre>{json.dumps(entry, indent=2, default=str)}</pre>
-        </section>
-    </main>
-</body>
-</html>
-"""
+        safe_id = _UNSAFE_ID_CHARS_RE.sub("_", str(tick_id))
+        
+        template = self.jinja_env.get_template("archive.html")
+        html = template.render(
+            tick_id=tick_id,
+            timestamp=timestamp,
+            # Single-line JSON; the page wraps it with CSS (.event-json)
+            entry_json=json.dumps(entry, default=str),
+        )
         
-        output_path = self.output_dir / "archive" / f"{safe_id}.html"
-        output_path.write_text(html)
-        return output_path
+        return self._write_if_changed(self.output_dir / "archive" / f"{safe_id}.html", html)
     
     def _generate_articles(self, context: Dict[str, Any]) -> List[Path]:
-        """Generate article pages from Editor.js JSON files."""
+        """Generate article pages from Editor.js JSON files.
+        
+        Loading (and decrypting) each article and rendering its page are
+        independent per article, so both passes run on a thread pool; the
+        heavy parts (PBKDF2/AES, file reads) release the GIL. Pages are
+        written in order once rendering is done.
+        """
         files_generated = []
         visible_articles = context.get("visible_articles", [])
         
@@ -644,86 +861,82 @@ class SiteGenerator:
             return files_generated
         
         articles_dir = self.output_dir / "articles"
-        articles_dir.mkdir(exist_ok=True)
         
-        articles_data = []
-        articles_html = []  # Parallel list of rendered HTML content
+        # Build media resolver for articles (one level deep: ../)
+        media_map = context.get("_media_map", {})
+        media_resolver = self._build_media_resolver(media_map, base_path="../")
         
-        # Pass 1: Collect all article data and render content
-        for article_meta in visible_articles:
-            slug = getattr(article_meta, "slug", "")
-            title = getattr(article_meta, "title", slug)
-            description = getattr(article_meta, "description", "")
-            
-            # Load article content (transparently decrypts encrypted articles)
-            content_path = Path(__file__).parent.parent.parent / "content" / "articles" / f"{slug}.json"
-            if content_path.exists():
-                try:
-                    from ..content.crypto import load_article
-                    from .editorjs import EditorJSRenderer
-                    article_data = load_article(content_path)
-                    
-                    # Build media resolver for articles (one level deep: ../)
-                    media_map = context.get("_media_map", {})
-                    media_resolver = self._build_media_resolver(media_map, base_path="../")
-                    renderer = EditorJSRenderer(media_resolver=media_resolver)
-                    content_html = renderer.render(article_data)
-                except ValueError as e:
-                    # Encrypted but no key available
-                    logger.warning(f"Skipping encrypted article '{slug}': {e}")
-                    content_html = "<p>🔒 This article is encrypted. Decryption key required.</p>"
-                except Exception as e:
-                    logger.error(f"Failed to load article '{slug}': {e}")
-                    content_html = "<p>Failed to load article content.</p>"
-            else:
-                content_html = "<p>Article content not found.</p>"
-            
-            articles_data.append({
-                "title": title,
-                "slug": slug,
-                "description": description,
-            })
-            articles_html.append(content_html)
-        
-        # Pass 2: Render each article page with prev/next navigation
-        for i, (a_data, content_html) in enumerate(zip(articles_data, articles_html)):
-            prev_article = articles_data[i - 1] if i > 0 else None
-            next_article = articles_data[i + 1] if i < len(articles_data) - 1 else None
-            
-            article_context = {
-                **context,
-                "base_path": "../",  # Articles are in subdirectory
-                "article": {
-                    **a_data,
-                    "content": content_html,
-                },
-                "prev_article": prev_article,
-                "next_article": next_article,
+        articles_data = [
+            {
+                "title": getattr(article_meta, "title", getattr(article_meta, "slug", "")),
+                "slug": getattr(article_meta, "slug", ""),
+                "description": getattr(article_meta, "description", ""),
             }
-            
-            # Render article page
-            template = self.jinja_env.get_template("article.html")
-            html = template.render(**article_context)
-            
-            output_path = articles_dir / f"{a_data['slug']}.html"
-            output_path.write_text(html)
-            files_generated.append(output_path)
+            for article_meta in visible_articles
+        ]
         
-        # Render article index
-        index_context = {
+        template = self.jinja_env.get_template("article.html")
+        # Context shared by every page in articles/, built once; Jinja's
+        # render(mapping, **extra) merges the per-page keys in a single copy
+        articles_context = {
             **context,
             "base_path": "../",  # Articles are in subdirectory
-            "articles": articles_data,
         }
+        
+        def render_page(i: int, content_html: str) -> str:
+            return template.render(
+                articles_context,
+                article={**articles_data[i], "content": content_html},
+                prev_article=articles_data[i - 1] if i > 0 else None,
+                next_article=articles_data[i + 1] if i < len(articles_data) - 1 else None,
+            )
+        
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(articles_data))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # Pass 1: Load and render each article's content
+            articles_html = list(pool.map(
+                lambda a: self._render_article_content(a["slug"], media_resolver),
+                articles_data,
+            ))
+            # Pass 2: Render each article page with prev/next navigation
+            pages = list(pool.map(render_page, range(len(articles_data)), articles_html))
+        
+        for a_data, html in zip(articles_data, pages):
+            output_path = articles_dir / f"{a_data['slug']}.html"
+            files_generated.append(self._write_if_changed(output_path, html))
+        
+        # Render article index
         template = self.jinja_env.get_template("articles_index.html")
-        html = template.render(**index_context)
+        html = template.render(articles_context, articles=articles_data)
         
-        index_path = articles_dir / "index.html"
-        index_path.write_text(html)
-        files_generated.append(index_path)
+        files_generated.append(self._write_if_changed(articles_dir / "index.html", html))
         
         return files_generated
     
+    def _render_article_content(
+        self,
+        slug: str,
+        media_resolver: Callable[[str], Optional[str]],
+    ) -> str:
+        """Load an article (transparently decrypting it) and render it to HTML."""
+        content_path = _ARTICLES_DIR / f"{slug}.json"
+        if not content_path.exists():
+            return "<p>Article content not found.</p>"
+        
+        try:
+            from ..content.crypto import load_article
+            from .editorjs import EditorJSRenderer
+            article_data = load_article(content_path)
+            renderer = EditorJSRenderer(media_resolver=media_resolver)
+            return renderer.render(article_data)
+        except ValueError as e:
+            # Encrypted but no key available
+            logger.warning(f"Skipping encrypted article '{slug}': {e}")
+            return "<p>🔒 This article is encrypted. Decryption key required.</p>"
+        except Exception as e:
+            logger.error(f"Failed to load article '{slug}': {e}")
+            return "<p>Failed to load article content.</p>"
+    
     def _generate_sitemap(self, context: Dict[str, Any]) -> Optional[Path]:
         """Generate sitemap.xml for search engines and Wayback Machine."""
         github_repo = context.get("github_repository", "")
@@ -733,7 +946,7 @@ class SiteGenerator:
         
         owner, repo = github_repo.split("/", 1)
         base_url = f"https://{owner}.github.io/{repo}"
-        now_iso = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
+        now_iso = datetime.fromisoformat(context["build_time"]).strftime("%Y-%m-%dT%H:%M:%S+00:00")
         
         # Core pages
         pages = [
@@ -744,6 +957,8 @@ class SiteGenerator:
             ("privacy.html", "0.3", "monthly"),
             ("terms.html", "0.3", "monthly"),
         ]
+        if not context.get("include_full_state", True):
+            pages.remove(("status.html", "0.6", "hourly"))
         
         # Articles
         visible_articles = context.get("visible_articles", [])
@@ -754,26 +969,25 @@ class SiteGenerator:
                 if slug:
                     pages.append((f"articles/{slug}.html", "0.9", "weekly"))
         
-        # Build XML
-        urls_xml = ""
+        # Build XML in one flat buffer
+        parts = [
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        ]
         for path, priority, changefreq in pages:
             loc = f"{base_url}/{path}" if path else f"{base_url}/"
-            urls_xml += f"""  <url>
-    <loc>{loc}</loc>
-    <lastmod>{now_iso}</lastmod>
-    <changefreq>{changefreq}</changefreq>
-    <priority>{priority}</priority>
-  </url>
-"""
-        
-        sitemap = f"""<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-{urls_xml}</urlset>
-"""
+            parts.append(
+                f"  <url>\n"
+                f"    <loc>{loc}</loc>\n"
+                f"    <lastmod>{now_iso}</lastmod>\n"
+                f"    <changefreq>{changefreq}</changefreq>\n"
+                f"    <priority>{priority}</priority>\n"
+                f"  </url>\n"
+            )
+        parts.append("</urlset>\n")
+        sitemap = "".join(parts)
         
-        output_path = self.output_dir / "sitemap.xml"
-        output_path.write_text(sitemap)
-        return output_path
+        return self._write_if_changed(self.output_dir / "sitemap.xml", sitemap)
     
     @staticmethod
     def get_archivable_paths(output_dir: Path) -> List[str]:
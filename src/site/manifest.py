@@ -15,40 +15,54 @@ Articles only become visible when the system reaches their minimum stage.
 from __future__ import annotations
 
 import logging
+import os
 from dataclasses import dataclass, field
+from enum import IntEnum
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import yaml
 
 logger = logging.getLogger(__name__)
 
-# Stage order for comparison
-STAGE_ORDER = {
-    "OK": 0,
-    "REMIND_1": 10,
-    "REMIND_2": 20,
-    "PRE_RELEASE": 30,
-    "PARTIAL": 40,
-    "FULL": 50,
-}
+# libyaml's C parser when available; same output as SafeLoader
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
+# Shared read-only stand-in for absent manifest sections
+_NO_SETTINGS: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass
+class Stage(IntEnum):
+    """Escalation stages in visibility order."""
+    
+    OK = 0
+    REMIND_1 = 10
+    REMIND_2 = 20
+    PRE_RELEASE = 30
+    PARTIAL = 40
+    FULL = 50
+
+
+# Stage order for comparison, keyed by stage name
+STAGE_ORDER: Dict[str, Stage] = dict(Stage.__members__)
+
+
+@dataclass(slots=True)
 class ArticleVisibility:
     """Visibility settings for an article."""
     
     min_stage: str = "FULL"
     include_in_nav: bool = False
     pin_to_top: bool = False
+    # min_stage as a Stage, resolved once at construction (unknown → FULL)
+    min_stage_order: Stage = field(init=False, repr=False, compare=False)
     
-    @property
-    def min_stage_order(self) -> int:
-        """Get numeric order of minimum stage."""
-        return STAGE_ORDER.get(self.min_stage, 50)
+    def __post_init__(self) -> None:
+        self.min_stage_order = STAGE_ORDER.get(self.min_stage, Stage.FULL)
 
 
-@dataclass
+@dataclass(slots=True)
 class ArticleMeta:
     """Metadata for an article."""
     
@@ -57,7 +71,7 @@ class ArticleMeta:
     tags: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ArticleEntry:
     """Entry in the content manifest."""
     
@@ -65,14 +79,18 @@ class ArticleEntry:
     title: str
     visibility: ArticleVisibility
     meta: ArticleMeta = field(default_factory=ArticleMeta)
+    # Listing order: pinned first, then case-insensitive title
+    _sort_key: Tuple[bool, str, str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self._sort_key = (not self.visibility.pin_to_top, self.title.casefold(), self.title)
     
     def is_visible_at(self, stage: str) -> bool:
         """Check if article is visible at given stage."""
-        current_order = STAGE_ORDER.get(stage, 0)
-        return current_order >= self.visibility.min_stage_order
+        return STAGE_ORDER.get(stage, Stage.OK) >= self.visibility.min_stage_order
 
 
-@dataclass
+@dataclass(slots=True)
 class StageBehavior:
     """Site behavior settings for a specific stage."""
     
@@ -82,7 +100,7 @@ class StageBehavior:
     banner_class: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DefaultVisibility:
     """Default visibility for unlisted articles."""
     
@@ -110,6 +128,14 @@ class ContentManifest:
         
         # Index by slug for quick lookup
         self._by_slug = {a.slug: a for a in articles}
+        
+        # Pre-sorted once: pinned first, then by title. Filtering keeps
+        # the order, so visibility queries never need to re-sort.
+        self._sorted_articles = sorted(articles, key=attrgetter("_sort_key"))
+        
+        # Per-stage query results; the manifest is not mutated after load
+        self._visible_cache: Dict[str, List[ArticleEntry]] = {}
+        self._nav_cache: Dict[str, List[ArticleEntry]] = {}
     
     @classmethod
     def load(cls, path: Optional[Path] = None) -> "ContentManifest":
@@ -122,8 +148,8 @@ class ContentManifest:
             return cls._empty()
         
         try:
-            with open(path) as f:
-                data = yaml.safe_load(f)
+            with open(path, "rb") as f:
+                data = yaml.load(f, Loader=_YamlLoader)
             
             return cls._from_dict(data, manifest_path=path)
         except Exception as e:
@@ -149,14 +175,14 @@ class ContentManifest:
         """Parse manifest from dictionary."""
         articles = []
         for a in data.get("articles", []):
-            vis_data = a.get("visibility", {})
+            vis_data = a.get("visibility") or _NO_SETTINGS
             visibility = ArticleVisibility(
                 min_stage=vis_data.get("min_stage", "FULL"),
                 include_in_nav=vis_data.get("include_in_nav", False),
                 pin_to_top=vis_data.get("pin_to_top", False),
             )
             
-            meta_data = a.get("meta", {})
+            meta_data = a.get("meta") or _NO_SETTINGS
             meta = ArticleMeta(
                 description=meta_data.get("description"),
                 author=meta_data.get("author"),
@@ -170,7 +196,8 @@ class ContentManifest:
                 meta=meta,
             ))
         
-        defaults_data = data.get("defaults", {}).get("visibility", data.get("defaults", {}))
+        defaults_root = data.get("defaults") or _NO_SETTINGS
+        defaults_data = defaults_root.get("visibility", defaults_root)
         defaults = DefaultVisibility(
             min_stage=defaults_data.get("min_stage", "FULL"),
             include_in_nav=defaults_data.get("include_in_nav", False),
@@ -181,9 +208,13 @@ class ContentManifest:
         known_slugs = {a.slug for a in articles}
         manifest_dir = manifest_path.parent if manifest_path else cls._default_path().parent
         articles_dir = manifest_dir / "articles"
-        if articles_dir.exists():
-            for json_file in sorted(articles_dir.glob("*.json")):
-                slug = json_file.stem
+        if articles_dir.is_dir():
+            with os.scandir(articles_dir) as it:
+                names = sorted(
+                    e.name for e in it if e.name.endswith(".json") and e.is_file()
+                )
+            for name in names:
+                slug = name[:-5]
                 if slug not in known_slugs:
                     # Title from slug: "full_disclosure" -> "Full Disclosure"
                     title = slug.replace("_", " ").replace("-", " ").title()
@@ -215,12 +246,21 @@ class ContentManifest:
         return self._by_slug.get(slug)
     
     def get_visible_articles(self, stage: str) -> List[ArticleEntry]:
-        """Get all articles visible at the given stage."""
-        visible = [a for a in self.articles if a.is_visible_at(stage)]
-        
-        # Sort: pinned first, then by title
-        visible.sort(key=lambda a: (not a.visibility.pin_to_top, a.title))
+        """
+        Get all articles visible at the given stage.
         
+        Results are cached per stage and shared between callers; treat
+        the returned list as read-only.
+        """
+        visible = self._visible_cache.get(stage)
+        if visible is None:
+            # Already sorted (pinned first, then by title) in __init__
+            current_order = STAGE_ORDER.get(stage, Stage.OK)
+            visible = [
+                a for a in self._sorted_articles
+                if current_order >= a.visibility.min_stage_order
+            ]
+            self._visible_cache[stage] = visible
         return visible
     
     def is_article_visible(self, slug: str, stage: str) -> bool:
@@ -230,15 +270,23 @@ class ContentManifest:
             return article.is_visible_at(stage)
         
         # Article not in manifest, use defaults
-        default_order = STAGE_ORDER.get(self.defaults.min_stage, 50)
-        current_order = STAGE_ORDER.get(stage, 0)
-        return current_order >= default_order
+        default_order = STAGE_ORDER.get(self.defaults.min_stage, Stage.FULL)
+        return STAGE_ORDER.get(stage, Stage.OK) >= default_order
     
     def get_stage_behavior(self, stage: str) -> StageBehavior:
         """Get site behavior for a stage."""
         return self.site_behavior.get(stage, StageBehavior())
     
     def get_nav_articles(self, stage: str) -> List[ArticleEntry]:
-        """Get articles to show in navigation at given stage."""
-        visible = self.get_visible_articles(stage)
-        return [a for a in visible if a.visibility.include_in_nav]
+        """Get articles to show in navigation at given stage (cached, read-only)."""
+        nav = self._nav_cache.get(stage)
+        if nav is None:
+            # Cheap nav flag first; presorted, so no visible list or re-sort
+            current_order = STAGE_ORDER.get(stage, Stage.OK)
+            nav = [
+                a for a in self._sorted_articles
+                if a.visibility.include_in_nav
+                and current_order >= a.visibility.min_stage_order
+            ]
+            self._nav_cache[stage] = nav
+        return nav
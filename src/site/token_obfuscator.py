@@ -20,11 +20,44 @@ from __future__ import annotations
 
 import os
 import random
+import secrets
+import string
 from typing import Dict, List
 
+# JS reassembly function; only the two attribute names vary per build.
+# Minified-ish, with non-obvious variable names.
+_JS_DECRYPT = string.Template("""
+    function _rt() {
+        try {
+            var _c = [], _k = [];
+            document.querySelectorAll('[$cipher_attr]').forEach(function(e) {
+                var p = e.getAttribute('$cipher_attr').split(':');
+                _c[parseInt(p[0])] = p[1];
+            });
+            document.querySelectorAll('[$key_attr]').forEach(function(e) {
+                var p = e.getAttribute('$key_attr').split(':');
+                _k[parseInt(p[0])] = p[1];
+            });
+            var ch = _c.join(''), kh = _k.join('');
+            if (!ch || !kh || ch.length !== kh.length) return '';
+            var out = '';
+            for (var i = 0; i < ch.length; i += 2) {
+                out += String.fromCharCode(
+                    parseInt(ch.substr(i, 2), 16) ^
+                    parseInt(kh.substr(i, 2), 16)
+                );
+            }
+            return out;
+        } catch(e) { return ''; }
+    }""")
+
 
 def _xor_bytes(data: bytes, key: bytes) -> bytes:
     """XOR data with key (key is cycled if shorter)."""
+    if len(key) == len(data):
+        # Equal lengths (the normal case): one big-int XOR instead of a per-byte loop
+        n = len(data)
+        return (int.from_bytes(data, "big") ^ int.from_bytes(key, "big")).to_bytes(n, "big")
     return bytes(d ^ key[i % len(key)] for i, d in enumerate(data))
 
 
@@ -43,20 +76,31 @@ def _split_hex(hex_str: str, n_chunks: int) -> List[str]:
 
 def _random_hex(length: int) -> str:
     """Generate a random hex string of given length."""
-    return os.urandom(length // 2 + 1).hex()[:length]
+    if length % 2:
+        return secrets.token_hex(length // 2 + 1)[:length]
+    return secrets.token_hex(length // 2)
 
 
-def _random_class_name() -> str:
-    """Generate an innocent-looking CSS class name."""
-    prefixes = [
-        "ui", "el", "nd", "vw", "st", "mt", "pg", "wx", "fn", "bk",
-        "ld", "rt", "sc", "gd", "fx", "hd", "tx", "ly", "sp", "cr",
-    ]
-    suffixes = [
-        "data", "meta", "info", "hint", "mark", "note", "flag", "prop",
-        "attr", "spec", "conf", "bind", "slot", "item", "cell", "part",
-    ]
-    return random.choice(prefixes) + "-" + random.choice(suffixes)
+# Innocent-looking CSS class name parts
+_CLASS_PREFIXES = (
+    "ui", "el", "nd", "vw", "st", "mt", "pg", "wx", "fn", "bk",
+    "ld", "rt", "sc", "gd", "fx", "hd", "tx", "ly", "sp", "cr",
+)
+_CLASS_SUFFIXES = (
+    "data", "meta", "info", "hint", "mark", "note", "flag", "prop",
+    "attr", "spec", "conf", "bind", "slot", "item", "cell", "part",
+)
+
+
+# Hidden fragment: class, data attribute, order index, hex chunk
+_SPAN_FMT = '<span class="{}" {}="{}:{}" style="display:none"></span>'
+
+
+def _random_class_names(n: int) -> List[str]:
+    """Generate n innocent-looking CSS class names."""
+    prefixes = random.choices(_CLASS_PREFIXES, k=n)
+    suffixes = random.choices(_CLASS_SUFFIXES, k=n)
+    return [p + "-" + s for p, s in zip(prefixes, suffixes)]
 
 
 def obfuscate_token(
@@ -97,71 +141,41 @@ def obfuscate_token(
     cipher_chunks = _split_hex(cipher_hex, n_fragments)
     key_chunks = _split_hex(key_hex, n_fragments)
 
-    # 4. Generate decoy fragments (same length distribution)
-    decoy_chunks = []
-    for i in range(n_decoys):
-        ref = cipher_chunks[i % len(cipher_chunks)]
-        decoy_chunks.append(_random_hex(len(ref)))
+    # 4-5. Draw all random hex in one urandom call, then slice out the
+    # decoy fragments (same length distribution) and the attribute names
+    decoy_lengths = [
+        len(cipher_chunks[i % len(cipher_chunks)]) for i in range(n_decoys)
+    ]
+    pool = _random_hex(3 * 6 + sum(decoy_lengths))
+
+    # Non-obvious attribute names that look like generic UI framework
+    # data attributes
+    cipher_attr = "data-v-" + pool[0:6]
+    key_attr = "data-v-" + pool[6:12]
+    decoy_attr = "data-v-" + pool[12:18]
 
-    # 5. Choose non-obvious attribute names
-    # These look like generic UI framework data attributes
-    cipher_attr = "data-v-" + _random_hex(6)
-    key_attr = "data-v-" + _random_hex(6)
-    decoy_attr = "data-v-" + _random_hex(6)
+    decoy_chunks = []
+    pos = 18
+    for length in decoy_lengths:
+        decoy_chunks.append(pool[pos:pos + length])
+        pos += length
 
     # 6. Build HTML fragments with order indices
-    all_fragments = []
-
-    for i, chunk in enumerate(cipher_chunks):
-        cls = _random_class_name()
-        all_fragments.append(
-            f'<span class="{cls}" {cipher_attr}="{i}:{chunk}" '
-            f'style="display:none"></span>'
-        )
-
-    for i, chunk in enumerate(key_chunks):
-        cls = _random_class_name()
-        all_fragments.append(
-            f'<span class="{cls}" {key_attr}="{i}:{chunk}" '
-            f'style="display:none"></span>'
-        )
-
-    for i, chunk in enumerate(decoy_chunks):
-        cls = _random_class_name()
-        all_fragments.append(
-            f'<span class="{cls}" {decoy_attr}="{i}:{chunk}" '
-            f'style="display:none"></span>'
-        )
+    classes = iter(_random_class_names(
+        len(cipher_chunks) + len(key_chunks) + len(decoy_chunks)
+    ))
+    fmt = _SPAN_FMT.format
+    all_fragments = (
+        [fmt(next(classes), cipher_attr, i, ch) for i, ch in enumerate(cipher_chunks)]
+        + [fmt(next(classes), key_attr, i, ch) for i, ch in enumerate(key_chunks)]
+        + [fmt(next(classes), decoy_attr, i, ch) for i, ch in enumerate(decoy_chunks)]
+    )
 
     # 7. Shuffle all fragments
     random.shuffle(all_fragments)
 
     # 8. Build JS reassembly function
-    # Minified-ish, with non-obvious variable names
-    js_decrypt = f"""
-    function _rt() {{
-        try {{
-            var _c = [], _k = [];
-            document.querySelectorAll('[{cipher_attr}]').forEach(function(e) {{
-                var p = e.getAttribute('{cipher_attr}').split(':');
-                _c[parseInt(p[0])] = p[1];
-            }});
-            document.querySelectorAll('[{key_attr}]').forEach(function(e) {{
-                var p = e.getAttribute('{key_attr}').split(':');
-                _k[parseInt(p[0])] = p[1];
-            }});
-            var ch = _c.join(''), kh = _k.join('');
-            if (!ch || !kh || ch.length !== kh.length) return '';
-            var out = '';
-            for (var i = 0; i < ch.length; i += 2) {{
-                out += String.fromCharCode(
-                    parseInt(ch.substr(i, 2), 16) ^
-                    parseInt(kh.substr(i, 2), 16)
-                );
-            }}
-            return out;
-        }} catch(e) {{ return ''; }}
-    }}"""
+    js_decrypt = _JS_DECRYPT.substitute(cipher_attr=cipher_attr, key_attr=key_attr)
 
     return {
         "fragments_html": all_fragments,
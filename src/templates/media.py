@@ -15,9 +15,10 @@ import json
 import logging
 import os
 import re
+import threading
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -27,11 +28,64 @@ logger = logging.getLogger(__name__)
 #   "video: ..."    → video
 #   "audio: ..."    → audio
 #   "file: ..."     → file/attachment
-MEDIA_MD_RE = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+# Alt text may not span lines and the URL may not contain whitespace, so
+# near-misses in long bodies fail at the first newline or space.
+# Compiled on first use — most adapter messages never contain media.
+_MEDIA_MD_PATTERN = r'!\[([^\]\n]*)\]\(([^)\s]+)\)'
+_MEDIA_MD_RE: Optional[re.Pattern] = None
+
+
+def _media_re() -> re.Pattern:
+    """Return the compiled media markdown regex, compiling it on first call."""
+    global _MEDIA_MD_RE
+    if _MEDIA_MD_RE is None:
+        _MEDIA_MD_RE = re.compile(_MEDIA_MD_PATTERN)
+    return _MEDIA_MD_RE
+
+
+def __getattr__(name: str):
+    # Keep the public MEDIA_MD_RE name importable without compiling at import
+    if name == "MEDIA_MD_RE":
+        return _media_re()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Prefix for media:// URI references
 MEDIA_URI_PREFIX = "media://"
 
+# Sentinel for "not computed yet" in the module-level caches below
+_UNSET = object()
+
+# Cheap pre-check: a media reference whose URL is a media:// URI.
+# Compiled on first use, like _media_re().
+_MEDIA_URI_MD_PATTERN = r'!\[[^\]\n]*\]\(media://'
+_MEDIA_URI_MD_RE: Optional[re.Pattern] = None
+
+
+def _media_uri_re() -> re.Pattern:
+    """Return the compiled media:// pre-check regex, compiling it on first call."""
+    global _MEDIA_URI_MD_RE
+    if _MEDIA_URI_MD_RE is None:
+        _MEDIA_URI_MD_RE = re.compile(_MEDIA_URI_MD_PATTERN)
+    return _MEDIA_URI_MD_RE
+
+# Alt-text type prefix (lower-cased, including colon) → media kind
+_ALT_PREFIXES: Dict[str, str] = {
+    "video:": "video",
+    "audio:": "audio",
+    "file:": "file",
+}
+
+
+def _split_alt(alt: str) -> Tuple[str, str]:
+    """Split stripped alt text into (kind, name); kind is "image" when unprefixed."""
+    # Only the head can hold a prefix — lower-case at most 6 chars, not the whole alt
+    head = alt[:6].lower()
+    prefix = head if head in _ALT_PREFIXES else head[:5]
+    kind = _ALT_PREFIXES.get(prefix)
+    if kind is None:
+        return "image", alt
+    return kind, alt[len(prefix):].strip()
+
 
 # ── Public URL Resolution ────────────────────────────────────────────
 
@@ -41,34 +95,57 @@ def get_site_base_url() -> Optional[str]:
     Determine the public base URL of the deployed site.
 
     Resolution priority:
-      1. Cached Cloudflare tunnel hostname (process-level cache)
+      1. Cached Cloudflare tunnel hostname (process-level cache, TTL-bound)
       2. Cloudflare tunnel detection (CLOUDFLARE_TUNNEL_TOKEN)
       3. GITHUB_REPOSITORY → GitHub Pages URL
       4. None — cannot resolve
 
+    Once the in-memory entry expires it is refreshed, but a failed refresh
+    keeps serving the stale hostname. A failed detection with nothing cached
+    is not retried until _TUNNEL_RETRY_BACKOFF has passed, and the fallback
+    decision (GitHub Pages URL or None) is reused for that window, so
+    renders don't each pay a disk read, an API round-trip, or a warning.
+
     Returns the base URL without trailing slash, or None.
     """
-    global _cached_tunnel_url
+    global _cached_tunnel_url, _cached_tunnel_expiry, _tunnel_retry_after
+    global _fallback_url
 
-    # 1. Return in-memory cached value if available
-    if _cached_tunnel_url:
-        return _cached_tunnel_url
+    now = time.time()
 
-    # 2. Try disk cache (survives process restarts, shared across processes)
-    disk_cached = _read_tunnel_cache()
-    if disk_cached:
-        _cached_tunnel_url = disk_cached
-        logger.debug(f"Resolved site base URL (disk cache): {_cached_tunnel_url}")
+    # 1. Return in-memory cached value while fresh
+    if _cached_tunnel_url and now < _cached_tunnel_expiry:
         return _cached_tunnel_url
 
-    # 3. Cloudflare tunnel detection via API
-    tunnel_url = _detect_cloudflare_tunnel_url()
-    if tunnel_url:
-        _cached_tunnel_url = tunnel_url.rstrip("/")
-        _write_tunnel_cache(_cached_tunnel_url)
-        logger.info(f"Resolved site base URL (Cloudflare): {_cached_tunnel_url}")
+    if now >= _tunnel_retry_after:
+        _fallback_url = _UNSET
+
+        # 2. Try disk cache (survives process restarts, shared across processes)
+        tunnel_url = _read_tunnel_cache()
+        if tunnel_url:
+            logger.debug(f"Resolved site base URL (disk cache): {tunnel_url}")
+        else:
+            # 3. Cloudflare tunnel detection via API
+            tunnel_url = _detect_cloudflare_tunnel_url()
+            if tunnel_url:
+                tunnel_url = tunnel_url.rstrip("/")
+                _write_tunnel_cache(tunnel_url)
+                logger.info(f"Resolved site base URL (Cloudflare): {tunnel_url}")
+
+        if tunnel_url:
+            _cached_tunnel_url = tunnel_url
+            _cached_tunnel_expiry = now + _TUNNEL_CACHE_TTL
+            return _cached_tunnel_url
+        _tunnel_retry_after = now + _TUNNEL_RETRY_BACKOFF
+
+    # Refresh failed — stale tunnel hostname beats the GitHub Pages fallback
+    if _cached_tunnel_url:
+        logger.debug(f"Using stale site base URL: {_cached_tunnel_url}")
         return _cached_tunnel_url
 
+    if _fallback_url is not _UNSET:
+        return _fallback_url
+
     # 3. GitHub Pages (fallback — media may NOT be served here)
     repo = os.environ.get("GITHUB_REPOSITORY", "").strip()
     if repo and "/" in repo:
@@ -78,13 +155,25 @@ def get_site_base_url() -> Optional[str]:
             f"Cloudflare tunnel detection failed, falling back to GitHub Pages: "
             f"{gh_url} — media files may not be available at this URL"
         )
+        _fallback_url = gh_url
         return gh_url
 
     # 4. Cannot resolve
     logger.warning("Cannot determine site base URL — no tunnel, no GITHUB_REPOSITORY")
+    _fallback_url = None
     return None
 
 
+def _reset_site_base_url_cache() -> None:
+    """Forget the in-memory tunnel hostname and retry backoff (for tests)."""
+    global _cached_tunnel_url, _cached_tunnel_expiry, _tunnel_retry_after
+    global _fallback_url
+    _cached_tunnel_url = None
+    _cached_tunnel_expiry = 0.0
+    _tunnel_retry_after = 0.0
+    _fallback_url = _UNSET
+
+
 def _detect_cloudflare_tunnel_url() -> Optional[str]:
     """
     Detect the public URL of a Cloudflare tunnel from the tunnel token.
@@ -150,10 +239,18 @@ _last_api_status: int = 0
 
 # Cache resolved tunnel hostname (in-memory + disk)
 _cached_tunnel_url: Optional[str] = None
+_cached_tunnel_expiry: float = 0.0
 
-# Disk cache TTL: 1 hour — tunnel hostnames rarely change
+# Cache TTL: 1 hour — tunnel hostnames rarely change
 _TUNNEL_CACHE_TTL = 3600
 
+# After a failed detection, skip the disk/API lookup for this long
+_TUNNEL_RETRY_BACKOFF = 300
+_tunnel_retry_after: float = 0.0
+
+# Fallback decision (GitHub Pages URL or None) made during the backoff window
+_fallback_url: object = _UNSET
+
 
 def _tunnel_cache_path() -> Path:
     """Path to the tunnel URL disk cache file."""
@@ -164,10 +261,7 @@ def _tunnel_cache_path() -> Path:
 def _read_tunnel_cache() -> Optional[str]:
     """Read tunnel URL from disk cache if still fresh."""
     try:
-        p = _tunnel_cache_path()
-        if not p.exists():
-            return None
-        data = json.loads(p.read_text())
+        data = json.loads(_tunnel_cache_path().read_bytes())
         url = data.get("url", "").strip()
         ts = data.get("ts", 0)
         if url and (time.time() - ts) < _TUNNEL_CACHE_TTL:
@@ -178,15 +272,72 @@ def _read_tunnel_cache() -> Optional[str]:
 
 
 def _write_tunnel_cache(url: str) -> None:
-    """Persist tunnel URL to disk cache."""
+    """
+    Persist tunnel URL to disk cache.
+
+    Skipped when a fresh entry already holds the same URL (another
+    process got there first). Uses atomic write (write to temp, then
+    rename) so a crash can't leave a truncated cache behind.
+    """
     try:
+        if _read_tunnel_cache() == url:
+            return
         p = _tunnel_cache_path()
         p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(json.dumps({"url": url, "ts": time.time()}))
+        temp_path = p.with_suffix(".tmp")
+        temp_path.write_text(json.dumps({"url": url, "ts": time.time()}))
+        temp_path.replace(p)
     except Exception as e:
         logger.debug(f"Failed to write tunnel cache: {e}")
 
 
+_CLOUDFLARE_API_HOST = "api.cloudflare.com"
+
+# Kept-alive HTTPS connection to the Cloudflare API, reused across calls
+# (e.g. the retry after a 401 token refresh skips a second TLS handshake)
+_cf_api_conn = None
+_cf_api_lock = threading.Lock()
+
+
+def _cloudflare_api_get(path: str, api_token: str) -> Tuple[int, bytes]:
+    """
+    GET a Cloudflare API path over the shared keep-alive connection.
+
+    Returns (status, body). If a reused connection fails (the server
+    closed it while idle), it is replaced and the request retried once.
+    """
+    import http.client
+
+    headers = {
+        "Authorization": f"Bearer {api_token}",
+        "Content-Type": "application/json",
+    }
+
+    def _send() -> Tuple[int, bytes]:
+        global _cf_api_conn
+        if _cf_api_conn is None:
+            _cf_api_conn = http.client.HTTPSConnection(_CLOUDFLARE_API_HOST, timeout=10)
+        try:
+            _cf_api_conn.request("GET", path, headers=headers)
+            resp = _cf_api_conn.getresponse()
+            return resp.status, resp.read()
+        except (http.client.HTTPException, OSError):
+            _cf_api_conn.close()
+            _cf_api_conn = None
+            raise
+
+    # The admin server calls this from request threads; one request at a time
+    with _cf_api_lock:
+        reused = _cf_api_conn is not None
+        try:
+            return _send()
+        except (http.client.HTTPException, OSError):
+            if not reused:
+                raise
+            # Server closed the idle kept-alive socket — retry on a fresh one
+            return _send()
+
+
 def _query_cloudflare_tunnel_hostname(
     account_id: str,
     tunnel_id: str,
@@ -199,23 +350,20 @@ def _query_cloudflare_tunnel_hostname(
     → extract first hostname from ingress rules.
     """
     global _last_api_status
-    import urllib.error
-    import urllib.request
 
-    url = (
-        f"https://api.cloudflare.com/client/v4/accounts/{account_id}"
+    path = (
+        f"/client/v4/accounts/{account_id}"
         f"/cfd_tunnel/{tunnel_id}/configurations"
     )
 
-    req = urllib.request.Request(url)
-    req.add_header("Authorization", f"Bearer {api_token}")
-    req.add_header("Content-Type", "application/json")
-
     try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            _last_api_status = resp.status
-            data = json.loads(resp.read())
+        status, body = _cloudflare_api_get(path, api_token)
+        _last_api_status = status
+        if status >= 400:
+            logger.debug(f"Cloudflare tunnel API HTTP {status}")
+            return None
 
+        data = json.loads(body)
         if not data.get("success"):
             errors = data.get("errors", [])
             logger.debug(f"Cloudflare tunnel API: {errors}")
@@ -233,11 +381,7 @@ def _query_cloudflare_tunnel_hostname(
         logger.debug("Cloudflare tunnel has no hostname in ingress rules")
         return None
 
-    except urllib.error.HTTPError as e:
-        _last_api_status = e.code
-        logger.debug(f"Cloudflare tunnel API HTTP {e.code}")
-        return None
-    except urllib.error.URLError as e:
+    except OSError as e:
         logger.debug(f"Cloudflare tunnel API unreachable: {e}")
         return None
     except Exception as e:
@@ -267,14 +411,45 @@ def resolve_media_uris(text: str, stage: str = "") -> str:
     Returns:
         Text with media:// URIs resolved to public URLs.
     """
-    # Quick check — skip work if no media:// URIs
-    if MEDIA_URI_PREFIX not in text:
+    # Quick checks — skip work unless a ![...](media://...) reference exists;
+    # "media://" in prose or only https:// images never resolves anything
+    if (
+        "![" not in text
+        or MEDIA_URI_PREFIX not in text
+        or not _media_uri_re().search(text)
+    ):
         return text
 
     # Lazy-load manifest and base URL only when needed
     base_url = get_site_base_url()
     manifest = _load_manifest()
 
+    manifest_get = manifest.get if manifest else None
+    # media_id → public URL, or None when it must be stripped to a label.
+    # Memoized per call so repeated embeds of one asset look it up once.
+    public_urls: Dict[str, Optional[str]] = {}
+
+    def _public_url(media_id: str) -> Optional[str]:
+        if manifest_get is None:
+            logger.warning("No media manifest available")
+            return None
+
+        entry = manifest_get(media_id)
+        if not entry:
+            # If we can't find the entry in the manifest we strip to a label
+            # (the site generator publishes under original_name, not the id)
+            logger.warning(f"Media '{media_id}' not found in manifest")
+            return None
+
+        # Stage visibility check
+        if stage and not entry.is_visible_at(stage):
+            logger.info(
+                f"Media '{media_id}' not visible at stage '{stage}', stripping"
+            )
+            return None
+
+        return f"{base_url}/media/{entry.original_name}"
+
     def _resolve(match: re.Match) -> str:
         alt = match.group(1)
         url = match.group(2)
@@ -292,62 +467,134 @@ def resolve_media_uris(text: str, stage: str = "") -> str:
             )
             return _to_label(alt)
 
-        # Look up in manifest
-        if manifest:
-            entry = manifest.get(media_id)
-            if entry:
-                # Stage visibility check
-                if stage and not entry.is_visible_at(stage):
-                    logger.info(
-                        f"Media '{media_id}' not visible at stage '{stage}', stripping"
-                    )
-                    return _to_label(alt)
-
-                # Resolve to public URL
-                public_url = f"{base_url}/media/{entry.original_name}"
-                return f"![{alt}]({public_url})"
-            else:
-                logger.warning(f"Media '{media_id}' not found in manifest")
+        if media_id in public_urls:
+            public_url = public_urls[media_id]
         else:
-            logger.warning("No media manifest available")
+            public_url = public_urls[media_id] = _public_url(media_id)
+
+        if public_url is None:
+            return _to_label(alt)
+        return f"![{alt}]({public_url})"
 
-        # If we can't find the entry in the manifest, we still try with the
-        # media_id as filename (best effort — the site generator uses original_name)
-        return _to_label(alt)
+    return _media_re().sub(_resolve, text)
 
-    return MEDIA_MD_RE.sub(_resolve, text)
+
+# Parsed media manifest, reused while the file's mtime is unchanged
+_manifest_cache: object = _UNSET
+_manifest_cache_key: Optional[int] = None
 
 
 def _load_manifest():
-    """Load the media manifest, returning None on failure."""
+    """
+    Load the media manifest, returning None on failure.
+
+    The parsed manifest is kept for the life of the process and only
+    re-read when manifest.json's mtime changes (the admin UI can add
+    media while the server is running).
+    """
+    global _manifest_cache, _manifest_cache_key
     try:
         from ..content.media import MediaManifest
-        return MediaManifest.load()
+        try:
+            key: Optional[int] = MediaManifest._default_path().stat().st_mtime_ns
+        except OSError:
+            key = None
+        if _manifest_cache is not _UNSET and key == _manifest_cache_key:
+            return _manifest_cache
+        manifest = MediaManifest.load()
     except Exception as e:
         logger.warning(f"Failed to load media manifest: {e}")
-        return None
+        manifest, key = None, None
+    _manifest_cache, _manifest_cache_key = manifest, key
+    return manifest
+
+
+def _reset_manifest_cache() -> None:
+    """Drop the cached media manifest (for tests)."""
+    global _manifest_cache, _manifest_cache_key
+    _manifest_cache, _manifest_cache_key = _UNSET, None
+
+
+# Media kind → (emoji, fallback name) for plain-text labels
+_LABELS: Dict[str, Tuple[str, str]] = {
+    "video": ("🎬", "video"),
+    "audio": ("🎵", "audio"),
+    "file": ("📎", "file"),
+    "image": ("📸", "image"),
+}
 
 
 def _to_label(alt: str) -> str:
     """Convert an alt text to a plain-text label."""
-    alt = alt.strip()
-    if alt.lower().startswith("video:"):
-        name = alt[6:].strip() or "video"
-        return f"[🎬 {name}]"
-    elif alt.lower().startswith("audio:"):
-        name = alt[6:].strip() or "audio"
-        return f"[🎵 {name}]"
-    elif alt.lower().startswith("file:"):
-        name = alt[5:].strip() or "file"
-        return f"[📎 {name}]"
-    else:
-        name = alt or "image"
-        return f"[📸 {name}]"
+    kind, name = _split_alt(alt.strip())
+    emoji, fallback = _LABELS[kind]
+    return f"[{emoji} {name or fallback}]"
 
 
 # ── Media Markdown → HTML (for email) ────────────────────────────────
 
 
+# Inline style fragments shared by the email HTML snippets below
+_STYLE_CARD = "margin:12px 0;padding:12px 16px;"
+_STYLE_LINK = "text-decoration:none;font-weight:600;"
+_STYLE_CAPTION = "font-size:12px;color:#64748b;"
+_STYLE_BORDER = "border:1px solid #e2e8f0;"
+
+
+def _html_card(box_style: str, link_color: str, icon: str, note: str) -> str:
+    """Build a linked media card template; filled with str.format(url=, caption=)."""
+    return (
+        f'<div style="{_STYLE_CARD}{box_style}">'
+        f'<a href="{{url}}" style="color:{link_color};{_STYLE_LINK}">'
+        f'{icon} {{caption}}</a>'
+        f'<div style="{_STYLE_CAPTION}margin-top:4px;">'
+        f'{note}</div></div>'
+    )
+
+
+# Email HTML snippets per media kind; filled with str.format(url=, caption=)
+_HTML_VIDEO_TPL = _html_card(
+    "background:#f1f5f9;border-radius:8px;border-left:4px solid #6366f1;",
+    "#6366f1", "🎬", "Video — click to view",
+)
+_HTML_AUDIO_TPL = _html_card(
+    "background:#f1f5f9;border-radius:8px;border-left:4px solid #8b5cf6;",
+    "#8b5cf6", "🎵", "Audio — click to listen",
+)
+_HTML_FILE_TPL = _html_card(
+    f"background:#f8fafc;border-radius:8px;{_STYLE_BORDER}",
+    "#6366f1", "📎", "File attachment — click to download",
+)
+_HTML_IMAGE_TPL = (
+    '<div style="margin:12px 0;text-align:center;">'
+    '<img src="{url}" alt="{caption}" '
+    f'style="max-width:100%;height:auto;border-radius:8px;{_STYLE_BORDER}">'
+    '{caption_html}</div>'
+)
+_HTML_IMAGE_CAPTION_TPL = (
+    f'<div style="{_STYLE_CAPTION}margin-top:6px;'
+    'font-style:italic;">{caption}</div>'
+)
+
+# Alt-text kind → (template, caption used when the alt text is empty)
+_HTML_TEMPLATES: Dict[str, Tuple[str, str]] = {
+    "video": (_HTML_VIDEO_TPL, "Video"),
+    "audio": (_HTML_AUDIO_TPL, "Audio"),
+    "file": (_HTML_FILE_TPL, "Attachment"),
+}
+
+
+def _render_media_html(kind: str, name: str, url: str) -> str:
+    """Render one media reference as email-safe HTML."""
+    if kind == "image":
+        caption = name or "Image"
+        caption_html = _HTML_IMAGE_CAPTION_TPL.format(caption=caption) if name else ""
+        return _HTML_IMAGE_TPL.format(url=url, caption=caption, caption_html=caption_html)
+
+    template, default_caption = _HTML_TEMPLATES[kind]
+    return template.format(url=url, caption=name or default_caption)
+
+
 def media_md_to_html(text: str) -> str:
     """
     Convert markdown media syntax to email-safe HTML.
@@ -361,54 +608,14 @@ def media_md_to_html(text: str) -> str:
     MUST be called BEFORE the general link regex to avoid ![text](url)
     being consumed by [text](url).
     """
-    def _render(match: re.Match) -> str:
-        alt = match.group(1).strip()
-        url = match.group(2)
+    if "![" not in text:
+        return text
 
-        if alt.lower().startswith("video:"):
-            caption = alt[6:].strip() or "Video"
-            return (
-                f'<div style="margin:12px 0;padding:12px 16px;'
-                f'background:#f1f5f9;border-radius:8px;border-left:4px solid #6366f1;">'
-                f'<a href="{url}" style="color:#6366f1;text-decoration:none;font-weight:600;">'
-                f'🎬 {caption}</a>'
-                f'<div style="font-size:12px;color:#64748b;margin-top:4px;">'
-                f'Video — click to view</div></div>'
-            )
-        elif alt.lower().startswith("audio:"):
-            caption = alt[6:].strip() or "Audio"
-            return (
-                f'<div style="margin:12px 0;padding:12px 16px;'
-                f'background:#f1f5f9;border-radius:8px;border-left:4px solid #8b5cf6;">'
-                f'<a href="{url}" style="color:#8b5cf6;text-decoration:none;font-weight:600;">'
-                f'🎵 {caption}</a>'
-                f'<div style="font-size:12px;color:#64748b;margin-top:4px;">'
-                f'Audio — click to listen</div></div>'
-            )
-        elif alt.lower().startswith("file:"):
-            filename = alt[5:].strip() or "Attachment"
-            return (
-                f'<div style="margin:12px 0;padding:12px 16px;'
-                f'background:#f8fafc;border-radius:8px;border:1px solid #e2e8f0;">'
-                f'<a href="{url}" style="color:#6366f1;text-decoration:none;font-weight:600;">'
-                f'📎 {filename}</a>'
-                f'<div style="font-size:12px;color:#64748b;margin-top:4px;">'
-                f'File attachment — click to download</div></div>'
-            )
-        else:
-            # Image (default)
-            alt_text = alt or "Image"
-            return (
-                f'<div style="margin:12px 0;text-align:center;">'
-                f'<img src="{url}" alt="{alt_text}" '
-                f'style="max-width:100%;height:auto;border-radius:8px;'
-                f'border:1px solid #e2e8f0;">'
-                + (f'<div style="font-size:12px;color:#64748b;margin-top:6px;'
-                   f'font-style:italic;">{alt_text}</div>' if alt else '')
-                + '</div>'
-            )
+    def _render(match: re.Match) -> str:
+        kind, name = _split_alt(match.group(1).strip())
+        return _render_media_html(kind, name, match.group(2))
 
-    return MEDIA_MD_RE.sub(_render, text)
+    return _media_re().sub(_render, text)
 
 
 # ── Strip Media for Plaintext Adapters ───────────────────────────────
@@ -424,8 +631,10 @@ def strip_media_to_labels(text: str) -> str:
       ![audio: cap](url)        → [🎵 cap]
       ![file: filename](url)    → [📎 filename]
     """
+    if "![" not in text:
+        return text
+
     def _label(match: re.Match) -> str:
-        alt = match.group(1).strip()
-        return _to_label(alt)
+        return _to_label(match.group(1))
 
-    return MEDIA_MD_RE.sub(_label, text)
+    return _media_re().sub(_label, text)
@@ -10,12 +10,63 @@ on load.
 from __future__ import annotations
 
 import logging
+import os
 import re
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# getattr() default that can't collide with a real attribute value
+_MISSING = object()
+
+
+def _lookup(obj: Any, parts: Tuple[str, ...]) -> Any:
+    """Walk pre-split dotted path parts through nested dicts/attributes."""
+    current = obj
+
+    for part in parts:
+        if isinstance(current, dict):
+            current = current.get(part)
+        else:
+            current = getattr(current, part, _MISSING)
+            if current is _MISSING:
+                return None
+
+        if current is None:
+            return None
+
+    return current
+
+
+class CompiledTemplate:
+    """
+    A template pre-split into literal text and ${{variable}} paths.
+
+    Produced by TemplateResolver.compile(); rendering walks the stored
+    pieces instead of re-running the placeholder regex.
+    """
+
+    __slots__ = ("_literals", "_paths")
+
+    def __init__(self, literals: List[str], paths: List[Tuple[str, ...]]):
+        # len(literals) == len(paths) + 1; placeholders sit between literals
+        self._literals = literals
+        self._paths = paths
+
+    def render(self, context: Dict[str, Any]) -> str:
+        """Substitute variables from context; missing ones become empty."""
+        literals = self._literals
+        out = [literals[0]]
+        for path, literal in zip(self._paths, literals[1:]):
+            value = _lookup(context, path)
+            if value is None:
+                logger.warning(f"Template variable not found: {'.'.join(path)}")
+            else:
+                out.append(str(value))
+            out.append(literal)
+        return "".join(out)
+
 
 class TemplateResolver:
     """
@@ -29,6 +80,7 @@ class TemplateResolver:
     SEARCH_ORDER = [
         "operator",
         "custodians",
+        "subscribers",
         "public",
         "articles",
         "",  # Root
@@ -37,8 +89,23 @@ class TemplateResolver:
     # Supported extensions, in order of preference
     EXTENSIONS = [".md", ".txt", ".html"]
 
+    # ${{variable}} placeholder, compiled once
+    _VAR_RE: ClassVar[re.Pattern] = re.compile(r"\$\{\{([^}]+)\}\}")
+
     def __init__(self, templates_dir: Path):
         self.templates_dir = templates_dir
+        # template name → resolved path (or None), filled by resolve()
+        self._resolve_cache: Dict[str, Optional[Path]] = {}
+        # directory → file names, filled by _list_dir()
+        self._dir_cache: Dict[Path, Optional[FrozenSet[str]]] = {}
+        # resolved path → (mtime_ns, compiled template), filled by load_compiled()
+        self._compiled_cache: Dict[Path, Tuple[int, CompiledTemplate]] = {}
+
+    def clear_cache(self) -> None:
+        """Forget resolved paths and compiled templates (e.g. after templates change on disk)."""
+        self._resolve_cache.clear()
+        self._dir_cache.clear()
+        self._compiled_cache.clear()
 
     def resolve(self, template_name: str) -> Optional[Path]:
         """
@@ -46,29 +113,64 @@ class TemplateResolver:
 
         Searches in multiple directories and extensions.
         Checks for encrypted (.enc) variants first, then plaintext.
-        Returns the first match or None.
+        Returns the first match or None. Results, including misses, are
+        cached for the lifetime of this resolver; see clear_cache().
         """
+        try:
+            return self._resolve_cache[template_name]
+        except KeyError:
+            pass
+
+        path = self._find(template_name)
+        self._resolve_cache[template_name] = path
+        return path
+
+    def _find(self, template_name: str) -> Optional[Path]:
+        """Search the template directories for a name (uncached)."""
+        # Plain names are matched against one directory listing per subdir;
+        # names with a path component fall back to per-candidate exists()
+        nested = "/" in template_name or os.sep in template_name
+
         for subdir in self.SEARCH_ORDER:
             base_path = self.templates_dir / subdir if subdir else self.templates_dir
-            if not base_path.exists():
+            entries = self._list_dir(base_path)
+            if entries is None:
                 continue
 
             for ext in self.EXTENSIONS:
                 # Check encrypted version first
-                enc_candidate = base_path / f"{template_name}{ext}.enc"
-                if enc_candidate.exists():
+                enc_name = f"{template_name}{ext}.enc"
+                if enc_name in entries or (nested and (base_path / enc_name).exists()):
+                    enc_candidate = base_path / enc_name
                     logger.debug(f"Resolved template '{template_name}' to {enc_candidate} (encrypted)")
                     return enc_candidate
 
                 # Then plaintext
-                candidate = base_path / f"{template_name}{ext}"
-                if candidate.exists():
+                name = f"{template_name}{ext}"
+                if name in entries or (nested and (base_path / name).exists()):
+                    candidate = base_path / name
                     logger.debug(f"Resolved template '{template_name}' to {candidate}")
                     return candidate
 
         logger.warning(f"Template '{template_name}' not found in {self.templates_dir}")
         return None
 
+    def _list_dir(self, path: Path) -> Optional[FrozenSet[str]]:
+        """Names in a template directory (None if missing), scanned once per resolver."""
+        try:
+            return self._dir_cache[path]
+        except KeyError:
+            pass
+
+        try:
+            with os.scandir(path) as it:
+                entries: Optional[FrozenSet[str]] = frozenset(e.name for e in it)
+        except (FileNotFoundError, NotADirectoryError):
+            entries = None
+
+        self._dir_cache[path] = entries
+        return entries
+
     def load(self, template_name: str) -> Optional[str]:
         """
         Load a template's content by name.
@@ -80,14 +182,18 @@ class TemplateResolver:
         if path is None:
             return None
 
-        return self._read_template(path)
+        return self.read(path)
 
-    def _read_template(self, path: Path) -> str:
+    @classmethod
+    def read(cls, path: Path) -> str:
         """
         Read a template file, decrypting if it is a .enc envelope.
+
+        Usable without a resolver instance, e.g. for a path the caller
+        already resolved.
         """
         if path.suffix == ".enc":
-            return self._decrypt_template(path)
+            return cls._decrypt_template(path)
 
         with path.open(encoding="utf-8") as f:
             return f.read()
@@ -130,27 +236,49 @@ class TemplateResolver:
 
             return str(value)
 
-        # Match ${{...}} pattern
-        pattern = r"\$\{\{([^}]+)\}\}"
-        return re.sub(pattern, replace_var, template_content)
+        return self._VAR_RE.sub(replace_var, template_content)
 
     def _get_nested(self, obj: Any, path: str) -> Any:
         """Get a value from nested dicts using dot notation."""
-        parts = path.split(".")
-        current = obj
-
-        for part in parts:
-            if isinstance(current, dict):
-                current = current.get(part)
-            elif hasattr(current, part):
-                current = getattr(current, part)
-            else:
-                return None
+        return _lookup(obj, tuple(path.split(".")))
 
-            if current is None:
-                return None
+    def compile(self, template_content: str) -> CompiledTemplate:
+        """
+        Pre-split a template for repeated rendering.
+
+        Same ${{variable}} semantics as render(); the regex scan and the
+        dotted-path splitting happen once here instead of on every render.
+        """
+        literals: List[str] = []
+        paths: List[Tuple[str, ...]] = []
+        pos = 0
+        for match in self._VAR_RE.finditer(template_content):
+            literals.append(template_content[pos:match.start()])
+            paths.append(tuple(match.group(1).strip().split(".")))
+            pos = match.end()
+        literals.append(template_content[pos:])
+        return CompiledTemplate(literals, paths)
+
+    def load_compiled(self, template_name: str) -> Optional[CompiledTemplate]:
+        """
+        Load and compile a template by name.
+
+        Compiled templates are kept per resolved file and reused until
+        the file's mtime changes, so a tick that renders the same
+        template for several actions reads and scans it once.
+        """
+        path = self.resolve(template_name)
+        if path is None:
+            return None
+
+        mtime = path.stat().st_mtime_ns
+        cached = self._compiled_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
 
-        return current
+        compiled = self.compile(self.read(path))
+        self._compiled_cache[path] = (mtime, compiled)
+        return compiled
 
     def resolve_and_render(
         self,
@@ -160,7 +288,7 @@ class TemplateResolver:
         """
         Convenience method to load and render in one step.
         """
-        content = self.load(template_name)
-        if content is None:
+        compiled = self.load_compiled(template_name)
+        if compiled is None:
             return None
-        return self.render(content, context)
+        return compiled.render(context)
@@ -17,8 +17,10 @@ Provides consistent validation patterns across the codebase.
 from __future__ import annotations
 
 import json
+import os
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Collection, Dict, Optional
 
 
 class ValidationError(Exception):
@@ -54,8 +56,10 @@ def validate_file_readable(path: Path, description: str = "File") -> None:
     if not path.is_file():
         raise ValidationError(f"{description} is not a file: {path}")
     
+    # Opening is enough to prove readability; don't read the contents
     try:
-        path.read_text()
+        with path.open("rb"):
+            pass
     except PermissionError:
         raise ValidationError(f"{description} is not readable: {path}")
     except Exception as e:
@@ -64,16 +68,23 @@ def validate_file_readable(path: Path, description: str = "File") -> None:
 
 def validate_json_file(path: Path, description: str = "JSON file") -> Dict[str, Any]:
     """Validate and load a JSON file."""
-    validate_file_readable(path, description)
-    
+    # Single read: open errors map to the same messages validate_file_readable uses
     try:
-        content = path.read_text()
-        return json.loads(content)
+        with path.open("rb") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise ValidationError(f"{description} does not exist: {path}")
+    except IsADirectoryError:
+        raise ValidationError(f"{description} is not a file: {path}")
+    except PermissionError:
+        raise ValidationError(f"{description} is not readable: {path}")
     except json.JSONDecodeError as e:
         raise ValidationError(
             f"Invalid JSON in {description}",
             details={"path": str(path), "error": str(e), "line": e.lineno},
         )
+    except (OSError, UnicodeDecodeError) as e:
+        raise ValidationError(f"{description} cannot be read: {e}")
 
 
 def validate_state_file(path: Path) -> Dict[str, Any]:
@@ -151,14 +162,16 @@ def validate_policy_dir(path: Path) -> Dict[str, Path]:
     
     # Check for at least one plan
     if plans_dir.exists() and plans_dir.is_dir():
-        plans = list(plans_dir.glob("*.yaml"))
-        if not plans:
+        # Only the first plan is needed; stop scanning once one is found
+        with os.scandir(plans_dir) as it:
+            first_plan = next((e for e in it if e.name.endswith(".yaml")), None)
+        if first_plan is None:
             raise ValidationError(
                 "No plan files found in plans directory",
                 details={"path": str(plans_dir)},
             )
         files["plans"] = plans_dir
-        files["default_plan"] = plans[0]
+        files["default_plan"] = Path(first_plan.path)
     else:
         raise ValidationError(
             "Plans directory not found",
@@ -178,10 +191,9 @@ def validate_deadline_iso(deadline_iso: str) -> bool:
     Raises:
         ValidationError: If invalid
     """
-    from dateutil import parser as date_parser
-    
     try:
-        date_parser.isoparse(deadline_iso)
+        # Python 3.11+ parses ISO 8601 (including a trailing "Z") natively
+        datetime.fromisoformat(deadline_iso)
         return True
     except (ValueError, TypeError) as e:
         raise ValidationError(
@@ -190,9 +202,12 @@ def validate_deadline_iso(deadline_iso: str) -> bool:
         )
 
 
-def validate_escalation_state(state: str, valid_states: List[str]) -> bool:
+def validate_escalation_state(state: str, valid_states: Collection[str]) -> bool:
     """
     Validate an escalation state value.
+
+    Pass a set/frozenset of states for hot loops; other collections are
+    converted once per call.
     
     Returns:
         True if valid
@@ -200,9 +215,11 @@ def validate_escalation_state(state: str, valid_states: List[str]) -> bool:
     Raises:
         ValidationError: If invalid
     """
+    if not isinstance(valid_states, (set, frozenset)):
+        valid_states = frozenset(valid_states)
     if state not in valid_states:
         raise ValidationError(
             f"Invalid escalation state: {state}",
-            details={"valid_states": valid_states},
+            details={"valid_states": sorted(valid_states)},
         )
     return True
@@ -1,38 +1,83 @@
 """
-Shared fixtures for admin route tests.
+Shared test fixtures.
 
-Provides a Flask test app with a temporary project root and pre-created
-directory structure so admin routes can operate without hitting the real
-filesystem.
+Content encryption fixtures are available to every test module. Admin route
+fixtures provide a Flask test app with a temporary project root and
+pre-created directory structure so admin routes can operate without hitting
+the real filesystem; they skip when Flask is not installed.
 """
 
 from __future__ import annotations
 
 import json
+import shutil
 from pathlib import Path
 
 import pytest
 
-pytest.importorskip("flask")
+# -- Content encryption -------------------------------------------------------
+
+# PBKDF2 iterations used by src.content.crypto during tests. The tests check
+# correctness and tamper detection, not key-stretching strength, and the
+# production 100 000 iterations dominate their runtime.
+TEST_KDF_ITERATIONS = 1_000
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _fast_content_kdf():
+    """Lower src.content.crypto.KDF_ITERATIONS for the whole session."""
+    from src.content import crypto
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(crypto, "KDF_ITERATIONS", TEST_KDF_ITERATIONS)
+        yield
+
+
+@pytest.fixture
+def no_encryption_key(monkeypatch, tmp_path: Path):
+    """Make CONTENT_ENCRYPTION_KEY unavailable from both os.environ and .env."""
+    from src.content import crypto
+
+    monkeypatch.delenv(crypto.ENV_VAR, raising=False)
+    monkeypatch.setattr(crypto, "_env_file_path", lambda: tmp_path / ".env")
+
+
+# -- Admin routes (Flask) -----------------------------------------------------
+
+# Standard project directories every admin test starts with (leaf paths only;
+# mkdir(parents=True) creates policy/ and content/ on the way)
+_PROJECT_DIRS = tuple(map(Path, (
+    "state",
+    "audit",
+    "policy/plans",
+    "content/articles",
+    "content/media",
+    "templates",
+    "backups",
+)))
+
+
+@pytest.fixture(scope="session")
+def project_template(tmp_path_factory) -> Path:
+    """Empty project directory skeleton, built once per session."""
+    root = tmp_path_factory.mktemp("proj_tmpl")
+    for rel in _PROJECT_DIRS:
+        (root / rel).mkdir(parents=True)
+    return root
 
 
 @pytest.fixture
-def app(tmp_path: Path):
+def app(tmp_path: Path, project_template: Path):
     """Create a Flask test app with temp project root."""
+    pytest.importorskip("flask")
     from src.admin.server import create_app
 
     app = create_app()
     app.config["PROJECT_ROOT"] = tmp_path
     app.config["TESTING"] = True
 
-    # Create the standard directory structure
-    (tmp_path / "state").mkdir()
-    (tmp_path / "audit").mkdir()
-    (tmp_path / "policy" / "plans").mkdir(parents=True)
-    (tmp_path / "content" / "articles").mkdir(parents=True)
-    (tmp_path / "content" / "media").mkdir(parents=True)
-    (tmp_path / "templates").mkdir()
-    (tmp_path / "backups").mkdir()
+    # Copy in the standard directory structure
+    shutil.copytree(project_template, tmp_path, dirs_exist_ok=True)
 
     return app
 
@@ -7,9 +7,8 @@ Uses Click's CliRunner to test commands without spawning subprocesses.
 from __future__ import annotations
 
 import json
-import os
+import shutil
 from pathlib import Path
-from unittest import mock
 
 import pytest
 from click.testing import CliRunner
@@ -38,29 +37,28 @@ PUBLIC_ARTICLE = {
     ],
 }
 
+_ABOUT_JSON = json.dumps(PUBLIC_ARTICLE, separators=(",", ":")).encode()
+_DISCLOSURE_JSON = json.dumps(SAMPLE_ARTICLE, separators=(",", ":")).encode()
+
+_MANIFEST_YAML = (
+    b"version: 1\narticles:\n"
+    b"  - slug: about\n    title: About\n    visibility:\n      min_stage: OK\n"
+    b"  - slug: disclosure\n    title: Disclosure\n    visibility:\n      min_stage: FULL\n"
+)
+
 
 def _setup_project(tmp_path: Path) -> Path:
     """Create a minimal project structure with test articles."""
     # Content
-    articles_dir = tmp_path / "content" / "articles"
+    content_dir = tmp_path / "content"
+    articles_dir = content_dir / "articles"
     articles_dir.mkdir(parents=True)
 
-    (articles_dir / "about.json").write_text(json.dumps(PUBLIC_ARTICLE, indent=2))
-    (articles_dir / "disclosure.json").write_text(json.dumps(SAMPLE_ARTICLE, indent=2))
+    (articles_dir / "about.json").write_bytes(_ABOUT_JSON)
+    (articles_dir / "disclosure.json").write_bytes(_DISCLOSURE_JSON)
 
     # Manifest
-    manifest = {
-        "version": 1,
-        "articles": [
-            {"slug": "about", "title": "About", "visibility": {"min_stage": "OK"}},
-            {"slug": "disclosure", "title": "Disclosure", "visibility": {"min_stage": "FULL"}},
-        ],
-    }
-    (tmp_path / "content" / "manifest.yaml").write_text(
-        "version: 1\narticles:\n"
-        "  - slug: about\n    title: About\n    visibility:\n      min_stage: OK\n"
-        "  - slug: disclosure\n    title: Disclosure\n    visibility:\n      min_stage: FULL\n"
-    )
+    (content_dir / "manifest.yaml").write_bytes(_MANIFEST_YAML)
 
     # State (minimal for CLI context)
     state_dir = tmp_path / "state"
@@ -70,13 +68,55 @@ def _setup_project(tmp_path: Path) -> Path:
     return tmp_path
 
 
-def _run(args: list, project_root: Path, env: dict | None = None) -> object:
-    """Run a CLI command against a temporary project root."""
-    runner = CliRunner()
+@pytest.fixture(scope="session")
+def content_template(tmp_path_factory) -> Path:
+    """Reference project tree, built once per session."""
+    return _setup_project(tmp_path_factory.mktemp("content_tmpl"))
+
+
+@pytest.fixture
+def project_root(tmp_path: Path, content_template: Path) -> Path:
+    """Per-test copy of the reference project tree."""
+    return shutil.copytree(content_template, tmp_path / "proj")
+
+
+@pytest.fixture(scope="session")
+def encrypted_disclosure_json() -> str:
+    """disclosure.json contents encrypted once per session (KDF is slow by design)."""
+    return json.dumps(encrypt_content(SAMPLE_ARTICLE, PASSPHRASE))
+
+
+@pytest.fixture(scope="session")
+def encrypted_about_json() -> str:
+    """about.json contents encrypted once per session."""
+    return json.dumps(encrypt_content(PUBLIC_ARTICLE, PASSPHRASE))
+
+
+# CliRunner keeps no state between invoke() calls, so one instance is shared
+_RUNNER = CliRunner()
+
+
+def _run(
+    args: list,
+    project_root: Path,
+    env: dict | None = None,
+    standalone_mode: bool = True,
+) -> object:
+    """
+    Run a CLI command against a temporary project root.
+
+    Pass standalone_mode=False to skip Click's exit/formatting wrapper
+    when a test only inspects the command's output.
+    """
     env_vars = {ENV_VAR: ""} if env is None else env
-    with mock.patch("src.main.get_project_root", return_value=project_root):
-        result = runner.invoke(cli, args, env=env_vars, catch_exceptions=False)
-    return result
+    return _RUNNER.invoke(
+        cli,
+        args,
+        obj={"root": project_root},
+        env=env_vars,
+        catch_exceptions=False,
+        standalone_mode=standalone_mode,
+    )
 
 
 # -- content-keygen tests -----------------------------------------------------
@@ -85,20 +125,18 @@ def _run(args: list, project_root: Path, env: dict | None = None) -> object:
 class TestContentKeygen:
     """Verify content-keygen command."""
 
-    def test_generates_key(self, tmp_path: Path):
+    def test_generates_key(self, project_root: Path):
         """Should output a key with instructions."""
-        root = _setup_project(tmp_path)
-        result = _run(["content-keygen"], root)
+        result = _run(["content-keygen"], project_root)
 
         assert result.exit_code == 0
         assert "CONTENT_ENCRYPTION_KEY=" in result.output
         assert "gh secret set" in result.output
 
-    def test_key_is_different_each_time(self, tmp_path: Path):
+    def test_key_is_different_each_time(self, project_root: Path):
         """Two invocations should produce different keys."""
-        root = _setup_project(tmp_path)
-        r1 = _run(["content-keygen"], root)
-        r2 = _run(["content-keygen"], root)
+        r1 = _run(["content-keygen"], project_root, standalone_mode=False)
+        r2 = _run(["content-keygen"], project_root, standalone_mode=False)
 
         # Extract keys (line containing CONTENT_ENCRYPTION_KEY=)
         key1 = [l for l in r1.output.split("\n") if "CONTENT_ENCRYPTION_KEY=" in l][0]
@@ -112,40 +150,32 @@ class TestContentKeygen:
 class TestContentStatus:
     """Verify content-status command."""
 
-    def test_shows_all_articles(self, tmp_path: Path):
+    def test_shows_all_articles(self, project_root: Path):
         """Should list all articles with their encryption status."""
-        root = _setup_project(tmp_path)
-        result = _run(["content-status"], root)
+        result = _run(["content-status"], project_root)
 
         assert result.exit_code == 0
         assert "about" in result.output
         assert "disclosure" in result.output
         assert "plaintext" in result.output
 
-    def test_shows_encrypted_articles(self, tmp_path: Path):
+    def test_shows_encrypted_articles(self, project_root: Path, encrypted_disclosure_json: str):
         """Should show encrypted status for encrypted articles."""
-        root = _setup_project(tmp_path)
-        articles_dir = root / "content" / "articles"
+        articles_dir = project_root / "content" / "articles"
 
         # Encrypt one article
-        data = json.loads((articles_dir / "disclosure.json").read_text())
-        envelope = encrypt_content(data, PASSPHRASE)
-        (articles_dir / "disclosure.json").write_text(json.dumps(envelope))
+        (articles_dir / "disclosure.json").write_text(encrypted_disclosure_json)
 
-        result = _run(["content-status"], root)
+        result = _run(["content-status"], project_root)
 
         assert result.exit_code == 0
         assert "encrypted" in result.output
         assert "1 encrypted" in result.output
         assert "1 plaintext" in result.output
 
-    def test_shows_key_not_set(self, tmp_path: Path):
+    def test_shows_key_not_set(self, project_root: Path, no_encryption_key):
         """Should indicate when the encryption key is not configured."""
-        root = _setup_project(tmp_path)
-        env_patch = {k: v for k, v in os.environ.items() if k != ENV_VAR}
-        with mock.patch.dict(os.environ, env_patch, clear=True), \
-             mock.patch("src.content.crypto._env_file_path", return_value=tmp_path / ".env"):
-            result = _run(["content-status"], root, env={})
+        result = _run(["content-status"], project_root, env={})
 
         assert result.exit_code == 0
         assert "Not set" in result.output
@@ -157,12 +187,11 @@ class TestContentStatus:
 class TestContentEncrypt:
     """Verify content-encrypt command."""
 
-    def test_encrypt_single_article(self, tmp_path: Path):
+    def test_encrypt_single_article(self, project_root: Path):
         """Should encrypt a specific article."""
-        root = _setup_project(tmp_path)
         result = _run(
             ["content-encrypt", "--slug", "disclosure"],
-            root,
+            project_root,
             env={ENV_VAR: PASSPHRASE},
         )
 
@@ -170,15 +199,14 @@ class TestContentEncrypt:
         assert "encrypted" in result.output
 
         # Verify file is encrypted
-        data = json.loads((root / "content" / "articles" / "disclosure.json").read_text())
+        data = json.loads((project_root / "content" / "articles" / "disclosure.json").read_text())
         assert is_encrypted(data)
 
-    def test_encrypt_all_articles(self, tmp_path: Path):
+    def test_encrypt_all_articles(self, project_root: Path):
         """Should encrypt all plaintext articles."""
-        root = _setup_project(tmp_path)
         result = _run(
             ["content-encrypt", "--all"],
-            root,
+            project_root,
             env={ENV_VAR: PASSPHRASE},
         )
 
@@ -186,15 +214,14 @@ class TestContentEncrypt:
 
         # Both files should be encrypted
         for name in ("about.json", "disclosure.json"):
-            data = json.loads((root / "content" / "articles" / name).read_text())
+            data = json.loads((project_root / "content" / "articles" / name).read_text())
             assert is_encrypted(data), f"{name} should be encrypted"
 
-    def test_encrypt_skip_public(self, tmp_path: Path):
+    def test_encrypt_skip_public(self, project_root: Path):
         """--skip-public should not encrypt articles with min_stage OK."""
-        root = _setup_project(tmp_path)
         result = _run(
             ["content-encrypt", "--all", "--skip-public"],
-            root,
+            project_root,
             env={ENV_VAR: PASSPHRASE},
         )
 
@@ -202,52 +229,43 @@ class TestContentEncrypt:
         assert "skipped" in result.output.lower() or "OK" in result.output
 
         # about.json (min_stage=OK) should remain plaintext
-        about = json.loads((root / "content" / "articles" / "about.json").read_text())
+        about = json.loads((project_root / "content" / "articles" / "about.json").read_text())
         assert not is_encrypted(about)
 
         # disclosure.json (min_stage=FULL) should be encrypted
-        disclosure = json.loads((root / "content" / "articles" / "disclosure.json").read_text())
+        disclosure = json.loads((project_root / "content" / "articles" / "disclosure.json").read_text())
         assert is_encrypted(disclosure)
 
-    def test_encrypt_already_encrypted_skipped(self, tmp_path: Path):
+    def test_encrypt_already_encrypted_skipped(self, project_root: Path, encrypted_disclosure_json: str):
         """Already-encrypted articles should be skipped."""
-        root = _setup_project(tmp_path)
-
         # Pre-encrypt
-        articles_dir = root / "content" / "articles"
-        data = json.loads((articles_dir / "disclosure.json").read_text())
-        envelope = encrypt_content(data, PASSPHRASE)
-        (articles_dir / "disclosure.json").write_text(json.dumps(envelope))
+        articles_dir = project_root / "content" / "articles"
+        (articles_dir / "disclosure.json").write_text(encrypted_disclosure_json)
 
         result = _run(
             ["content-encrypt", "--slug", "disclosure"],
-            root,
+            project_root,
             env={ENV_VAR: PASSPHRASE},
         )
 
         assert result.exit_code == 0
         assert "already encrypted" in result.output
 
-    def test_encrypt_no_key_fails(self, tmp_path: Path):
+    def test_encrypt_no_key_fails(self, project_root: Path, no_encryption_key):
         """Should fail if encryption key is not set."""
-        root = _setup_project(tmp_path)
-        env_patch = {k: v for k, v in os.environ.items() if k != ENV_VAR}
-        with mock.patch.dict(os.environ, env_patch, clear=True), \
-             mock.patch("src.content.crypto._env_file_path", return_value=tmp_path / ".env"):
-            result = _run(
-                ["content-encrypt", "--slug", "disclosure"],
-                root,
-                env={},
-            )
+        result = _run(
+            ["content-encrypt", "--slug", "disclosure"],
+            project_root,
+            env={},
+        )
 
         assert result.exit_code != 0
 
-    def test_encrypt_requires_slug_or_all(self, tmp_path: Path):
+    def test_encrypt_requires_slug_or_all(self, project_root: Path):
         """Should fail if neither --slug nor --all is specified."""
-        root = _setup_project(tmp_path)
         result = _run(
             ["content-encrypt"],
-            root,
+            project_root,
             env={ENV_VAR: PASSPHRASE},
         )
 
@@ -260,20 +278,17 @@ class TestContentEncrypt:
 class TestContentDecrypt:
     """Verify content-decrypt command."""
 
-    def test_decrypt_single_article(self, tmp_path: Path):
+    def test_decrypt_single_article(self, project_root: Path, encrypted_disclosure_json: str):
         """Should decrypt a specific article back to plaintext."""
-        root = _setup_project(tmp_path)
-        articles_dir = root / "content" / "articles"
+        articles_dir = project_root / "content" / "articles"
 
         # Encrypt first
-        data = json.loads((articles_dir / "disclosure.json").read_text())
-        envelope = encrypt_content(data, PASSPHRASE)
-        (articles_dir / "disclosure.json").write_text(json.dumps(envelope))
+        (articles_dir / "disclosure.json").write_text(encrypted_disclosure_json)
 
         # Now decrypt
         result = _run(
             ["content-decrypt", "--slug", "disclosure"],
-            root,
+            project_root,
             env={ENV_VAR: PASSPHRASE},
         )
 
@@ -285,20 +300,17 @@ class TestContentDecrypt:
         assert not is_encrypted(restored)
         assert restored["blocks"] == SAMPLE_ARTICLE["blocks"]
 
-    def test_decrypt_dry_run(self, tmp_path: Path):
+    def test_decrypt_dry_run(self, project_root: Path, encrypted_disclosure_json: str):
         """--dry-run should show content without modifying the file."""
-        root = _setup_project(tmp_path)
-        articles_dir = root / "content" / "articles"
+        articles_dir = project_root / "content" / "articles"
 
         # Encrypt first
-        data = json.loads((articles_dir / "disclosure.json").read_text())
-        envelope = encrypt_content(data, PASSPHRASE)
-        (articles_dir / "disclosure.json").write_text(json.dumps(envelope))
+        (articles_dir / "disclosure.json").write_text(encrypted_disclosure_json)
 
         # Dry-run decrypt
         result = _run(
             ["content-decrypt", "--slug", "disclosure", "--dry-run"],
-            root,
+            project_root,
             env={ENV_VAR: PASSPHRASE},
         )
 
@@ -310,21 +322,20 @@ class TestContentDecrypt:
         data_after = json.loads((articles_dir / "disclosure.json").read_text())
         assert is_encrypted(data_after)
 
-    def test_decrypt_all(self, tmp_path: Path):
+    def test_decrypt_all(
+        self, project_root: Path, encrypted_about_json: str, encrypted_disclosure_json: str
+    ):
         """--all should decrypt all encrypted articles."""
-        root = _setup_project(tmp_path)
-        articles_dir = root / "content" / "articles"
+        articles_dir = project_root / "content" / "articles"
 
         # Encrypt both
-        for name in ("about.json", "disclosure.json"):
-            data = json.loads((articles_dir / name).read_text())
-            envelope = encrypt_content(data, PASSPHRASE)
-            (articles_dir / name).write_text(json.dumps(envelope))
+        (articles_dir / "about.json").write_text(encrypted_about_json)
+        (articles_dir / "disclosure.json").write_text(encrypted_disclosure_json)
 
         # Decrypt all
         result = _run(
             ["content-decrypt", "--all"],
-            root,
+            project_root,
             env={ENV_VAR: PASSPHRASE},
         )
 
@@ -334,28 +345,23 @@ class TestContentDecrypt:
             data = json.loads((articles_dir / name).read_text())
             assert not is_encrypted(data)
 
-    def test_decrypt_plaintext_skipped(self, tmp_path: Path):
+    def test_decrypt_plaintext_skipped(self, project_root: Path):
         """Already-plaintext articles should be skipped."""
-        root = _setup_project(tmp_path)
         result = _run(
             ["content-decrypt", "--slug", "about"],
-            root,
+            project_root,
             env={ENV_VAR: PASSPHRASE},
         )
 
         assert result.exit_code == 0
         assert "already plaintext" in result.output
 
-    def test_decrypt_no_key_fails(self, tmp_path: Path):
+    def test_decrypt_no_key_fails(self, project_root: Path, no_encryption_key):
         """Should fail if encryption key is not set."""
-        root = _setup_project(tmp_path)
-        env_patch = {k: v for k, v in os.environ.items() if k != ENV_VAR}
-        with mock.patch.dict(os.environ, env_patch, clear=True), \
-             mock.patch("src.content.crypto._env_file_path", return_value=tmp_path / ".env"):
-            result = _run(
-                ["content-decrypt", "--slug", "disclosure"],
-                root,
-                env={},
-            )
-
-            assert result.exit_code != 0
+        result = _run(
+            ["content-decrypt", "--slug", "disclosure"],
+            project_root,
+            env={},
+        )
+
+        assert result.exit_code != 0
@@ -3,8 +3,6 @@ Tests for the Configuration Validator.
 """
 
 import pytest
-from unittest.mock import patch
-import os
 
 from src.config.validator import (
     ConfigValidator,
@@ -105,76 +103,93 @@ class TestAdapterRequirements:
         assert reqs["required"] == []
 
 
+# Every variable the validator reads
+_ADAPTER_ENV_VARS = {"ADAPTER_MOCK_MODE"} | {
+    var
+    for reqs in ADAPTER_REQUIREMENTS.values()
+    for var in (*reqs.get("required", []), *reqs.get("optional", []))
+}
+
+
+@pytest.fixture(scope="session")
+def validator():
+    """Shared validator; it keeps no state and reads os.environ on each call."""
+    return ConfigValidator()
+
+
+@pytest.fixture
+def clean_env(monkeypatch, request):
+    """
+    Unset every adapter variable, then set the ones given via indirect
+    parametrization. Only the variables the validator reads are touched,
+    so the rest of os.environ is never snapshotted or cleared.
+    """
+    for var in _ADAPTER_ENV_VARS:
+        monkeypatch.delenv(var, raising=False)
+    for var, value in getattr(request, "param", {}).items():
+        monkeypatch.setenv(var, value)
+
+
 class TestConfigValidator:
     """Tests for ConfigValidator."""
     
-    def test_validate_unknown_adapter(self):
+    def test_validate_unknown_adapter(self, validator):
         """Test validating unknown adapter."""
-        validator = ConfigValidator()
         status = validator.validate_adapter("unknown_adapter")
         
         assert status.configured is False
         assert status.mode == "unknown"
         assert "Unknown adapter" in status.guidance
     
-    def test_validate_adapter_all_present(self):
+    @pytest.mark.parametrize("clean_env", [{
+        "RESEND_API_KEY": "test_key",
+        "ADAPTER_MOCK_MODE": "false",
+    }], indirect=True)
+    def test_validate_adapter_all_present(self, clean_env, validator):
         """Test adapter with all required vars present."""
-        with patch.dict(os.environ, {
-            "RESEND_API_KEY": "test_key",
-            "ADAPTER_MOCK_MODE": "false",
-        }, clear=True):
-            validator = ConfigValidator()
-            status = validator.validate_adapter("email")
-            
-            assert status.configured is True
-            assert status.mode == "real"
-            assert "RESEND_API_KEY" in status.present
+        status = validator.validate_adapter("email")
+        
+        assert status.configured is True
+        assert status.mode == "real"
+        assert "RESEND_API_KEY" in status.present
     
-    def test_validate_adapter_missing_required(self):
+    def test_validate_adapter_missing_required(self, clean_env, validator):
         """Test adapter with missing required vars."""
-        with patch.dict(os.environ, {}, clear=True):
-            validator = ConfigValidator()
-            status = validator.validate_adapter("email")
-            
-            assert status.configured is False
-            assert "RESEND_API_KEY" in status.missing
+        status = validator.validate_adapter("email")
+        
+        assert status.configured is False
+        assert "RESEND_API_KEY" in status.missing
     
-    def test_validate_adapter_mock_mode(self):
+    def test_validate_adapter_mock_mode(self, monkeypatch, validator):
         """Test adapter in mock mode."""
-        with patch.dict(os.environ, {
-            "RESEND_API_KEY": "test_key",
-            "ADAPTER_MOCK_MODE": "true",
-        }):
-            validator = ConfigValidator()
-            status = validator.validate_adapter("email")
-            
-            assert status.configured is True
-            assert status.mode == "mock"
+        monkeypatch.setenv("RESEND_API_KEY", "test_key")
+        monkeypatch.setenv("ADAPTER_MOCK_MODE", "true")
+        status = validator.validate_adapter("email")
+        
+        assert status.configured is True
+        assert status.mode == "mock"
     
-    def test_validate_adapter_optional_present(self):
+    @pytest.mark.parametrize("clean_env", [{
+        "RESEND_API_KEY": "test_key",
+        "RESEND_FROM_EMAIL": "test@example.com",
+    }], indirect=True)
+    def test_validate_adapter_optional_present(self, clean_env, validator):
         """Test optional vars are tracked."""
-        with patch.dict(os.environ, {
-            "RESEND_API_KEY": "test_key",
-            "RESEND_FROM_EMAIL": "test@example.com",
-        }, clear=True):
-            validator = ConfigValidator()
-            status = validator.validate_adapter("email")
-            
-            assert "RESEND_API_KEY" in status.present
-            assert "RESEND_FROM_EMAIL" in status.present
+        status = validator.validate_adapter("email")
+        
+        assert "RESEND_API_KEY" in status.present
+        assert "RESEND_FROM_EMAIL" in status.present
     
-    def test_validate_adapter_no_required(self):
+    @pytest.mark.parametrize("clean_env", [{"ADAPTER_MOCK_MODE": "false"}], indirect=True)
+    def test_validate_adapter_no_required(self, clean_env, validator):
         """Test adapter with no required vars is configured."""
-        with patch.dict(os.environ, {"ADAPTER_MOCK_MODE": "false"}, clear=True):
-            validator = ConfigValidator()
-            status = validator.validate_adapter("webhook")
-            
-            assert status.configured is True
-            assert status.mode == "real"
+        status = validator.validate_adapter("webhook")
+        
+        assert status.configured is True
+        assert status.mode == "real"
     
-    def test_validate_all(self):
+    def test_validate_all(self, validator):
         """Test validate_all returns all adapters."""
-        validator = ConfigValidator()
         results = validator.validate_all()
         
         assert len(results) == len(ADAPTER_REQUIREMENTS)
@@ -182,83 +197,72 @@ class TestConfigValidator:
         assert "sms" in results
         assert "x" in results
     
-    def test_validate_sms_partial(self):
+    @pytest.mark.parametrize("clean_env", [{
+        "TWILIO_ACCOUNT_SID": "ACtest",
+        # Missing AUTH_TOKEN and FROM_NUMBER
+    }], indirect=True)
+    def test_validate_sms_partial(self, clean_env, validator):
         """Test SMS with partial credentials."""
-        with patch.dict(os.environ, {
-            "TWILIO_ACCOUNT_SID": "ACtest",
-            # Missing AUTH_TOKEN and FROM_NUMBER
-        }, clear=True):
-            validator = ConfigValidator()
-            status = validator.validate_adapter("sms")
-            
-            assert status.configured is False
-            assert "TWILIO_AUTH_TOKEN" in status.missing
-            assert "TWILIO_FROM_NUMBER" in status.missing
-            assert "TWILIO_ACCOUNT_SID" in status.present
+        status = validator.validate_adapter("sms")
+        
+        assert status.configured is False
+        assert "TWILIO_AUTH_TOKEN" in status.missing
+        assert "TWILIO_FROM_NUMBER" in status.missing
+        assert "TWILIO_ACCOUNT_SID" in status.present
     
-    def test_validate_x_complete(self):
+    @pytest.mark.parametrize("clean_env", [{
+        "X_API_KEY": "key",
+        "X_API_SECRET": "secret",
+        "X_ACCESS_TOKEN": "token",
+        "X_ACCESS_SECRET": "secret",
+        "ADAPTER_MOCK_MODE": "false",
+    }], indirect=True)
+    def test_validate_x_complete(self, clean_env, validator):
         """Test X adapter with complete credentials."""
-        with patch.dict(os.environ, {
-            "X_API_KEY": "key",
-            "X_API_SECRET": "secret",
-            "X_ACCESS_TOKEN": "token",
-            "X_ACCESS_SECRET": "secret",
-            "ADAPTER_MOCK_MODE": "false",
-        }, clear=True):
-            validator = ConfigValidator()
-            status = validator.validate_adapter("x")
-            
-            assert status.configured is True
-            assert status.mode == "real"
-            assert len(status.missing) == 0
+        status = validator.validate_adapter("x")
+        
+        assert status.configured is True
+        assert status.mode == "real"
+        assert len(status.missing) == 0
 
 
 class TestSetupGuide:
     """Tests for setup guide generation."""
     
-    def test_get_setup_guide_structure(self):
+    def test_get_setup_guide_structure(self, clean_env, validator):
         """Test setup guide has correct structure."""
-        with patch.dict(os.environ, {}, clear=True):
-            validator = ConfigValidator()
-            guide = validator.get_setup_guide()
-            
-            assert "# Configuration Setup Guide" in guide
-            assert "**Missing environment variables:**" in guide
+        guide = validator.get_setup_guide()
+        
+        assert "# Configuration Setup Guide" in guide
+        assert "**Missing environment variables:**" in guide
     
-    def test_get_setup_guide_includes_missing(self):
+    @pytest.mark.parametrize("clean_env", [{
+        "RESEND_API_KEY": "test",  # Email configured
+        # SMS not configured
+    }], indirect=True)
+    def test_get_setup_guide_includes_missing(self, clean_env, validator):
         """Test setup guide includes missing adapters."""
-        with patch.dict(os.environ, {
-            "RESEND_API_KEY": "test",  # Email configured
-            # SMS not configured
-        }, clear=True):
-            validator = ConfigValidator()
-            guide = validator.get_setup_guide()
-            
-            assert "## sms" in guide
-            assert "TWILIO_ACCOUNT_SID" in guide
+        guide = validator.get_setup_guide()
+        
+        assert "## sms" in guide
+        assert "TWILIO_ACCOUNT_SID" in guide
     
-    def test_get_setup_guide_includes_guidance(self):
+    def test_get_setup_guide_includes_guidance(self, clean_env, validator):
         """Test setup guide includes guidance links."""
-        with patch.dict(os.environ, {}, clear=True):
-            validator = ConfigValidator()
-            guide = validator.get_setup_guide()
-            
-            assert "https://resend.com" in guide or "resend.com" in guide.lower()
+        guide = validator.get_setup_guide()
+        
+        assert "https://resend.com" in guide or "resend.com" in guide.lower()
 
 
 class TestStartupCheck:
     """Tests for startup configuration check."""
     
-    def test_check_config_on_startup_runs(self):
+    def test_check_config_on_startup_runs(self, clean_env):
         """Test startup check doesn't crash."""
         # Just verify it runs without exception
-        with patch.dict(os.environ, {}, clear=True):
-            check_config_on_startup()
+        check_config_on_startup()
     
-    def test_log_status_runs(self):
+    @pytest.mark.parametrize("clean_env", [{"RESEND_API_KEY": "test"}], indirect=True)
+    def test_log_status_runs(self, clean_env, validator):
         """Test log_status doesn't crash."""
-        with patch.dict(os.environ, {
-            "RESEND_API_KEY": "test",
-        }, clear=True):
-            validator = ConfigValidator()
-            validator.log_status()  # Should not raise
+        validator.log_status()  # Should not raise
@@ -13,17 +13,26 @@ Covers:
 
 from __future__ import annotations
 
+import base64
+import binascii
+import hashlib
+import importlib.util
 import json
 import os
+import string
 from pathlib import Path
-from unittest import mock
 
 import pytest
+from cryptography.exceptions import InvalidTag
 
+from src.content import crypto
 from src.content.crypto import (
     ENV_VAR,
     decrypt_content,
+    decrypt_with_key,
+    derive_key,
     encrypt_content,
+    encrypt_with_key,
     generate_key,
     get_encryption_key,
     is_encrypted,
@@ -60,13 +69,65 @@ SAMPLE_CONTENT = {
     ],
 }
 
+# ~70 KB of plaintext, built once at import
+LARGE_CONTENT = {
+    "blocks": [
+        {"type": "paragraph", "data": {"text": f"Paragraph {i}" * 100}}
+        for i in range(100)
+    ]
+}
+
 PASSPHRASE = "test-passphrase-for-unit-tests-only"
 OTHER_PASSPHRASE = "completely-different-passphrase-value"
 
 
+@pytest.fixture(scope="session")
+def content_key() -> tuple:
+    """(key, salt) derived from PASSPHRASE once per session."""
+    salt = os.urandom(crypto.SALT_BYTES)
+    return derive_key(PASSPHRASE, salt), salt
+
+
+@pytest.fixture(scope="session")
+def sample_envelope(content_key) -> dict:
+    """
+    SAMPLE_CONTENT encrypted once per session with the shared key, so the
+    PBKDF2 cost is paid once. The envelope is flat; tests that tamper with
+    it take a dict() copy.
+    """
+    key, salt = content_key
+    return encrypt_with_key(SAMPLE_CONTENT, key, salt)
+
+
+@pytest.fixture
+def fast_kdf(monkeypatch):
+    """
+    Replace PBKDF2 with a single salted SHA-256 for tests that only check
+    the encrypt → decrypt round-trip. Salt-sensitive, so fresh encryptions
+    still get distinct keys. Don't combine with sample_envelope, which is
+    derived with the real KDF.
+    """
+    monkeypatch.setattr(
+        crypto,
+        "_derive_key",
+        lambda passphrase, salt: hashlib.sha256(passphrase.encode("utf-8") + salt).digest(),
+    )
+
+
+_URL_SAFE_CHARS = string.ascii_letters.encode() + string.digits.encode() + b"-_"
+
+
+def _tamper(envelope: dict, field: str) -> None:
+    """Flip the first byte of a base64 envelope field in place."""
+    raw = bytearray(binascii.a2b_base64(envelope[field]))
+    raw[0] ^= 0xFF
+    envelope[field] = binascii.b2a_base64(raw, newline=False).decode("ascii")
+
+
 # -- Round-trip tests ---------------------------------------------------------
 
 
+@pytest.mark.usefixtures("fast_kdf")
 class TestEncryptDecryptRoundtrip:
     """Verify that encrypt → decrypt returns identical content."""
 
@@ -99,15 +160,9 @@ class TestEncryptDecryptRoundtrip:
 
     def test_large_content(self):
         """Large content (many blocks) should encrypt/decrypt correctly."""
-        content = {
-            "blocks": [
-                {"type": "paragraph", "data": {"text": f"Paragraph {i}" * 100}}
-                for i in range(100)
-            ]
-        }
-        envelope = encrypt_content(content, PASSPHRASE)
+        envelope = encrypt_content(LARGE_CONTENT, PASSPHRASE)
         result = decrypt_content(envelope, PASSPHRASE)
-        assert result == content
+        assert result == LARGE_CONTENT
 
     def test_nested_json(self):
         """Deeply nested JSON structures should survive encryption."""
@@ -136,9 +191,9 @@ class TestEncryptDecryptRoundtrip:
 class TestIsEncrypted:
     """Verify encrypted envelope detection."""
 
-    def test_encrypted_envelope(self):
+    def test_encrypted_envelope(self, sample_envelope):
         """Encrypted envelope should be detected."""
-        envelope = encrypt_content(SAMPLE_CONTENT, PASSPHRASE)
+        envelope = sample_envelope
         assert is_encrypted(envelope) is True
 
     def test_plaintext_article(self):
@@ -174,11 +229,9 @@ class TestIsEncrypted:
 class TestSecurityProperties:
     """Verify cryptographic security properties."""
 
-    def test_wrong_passphrase_fails(self):
+    def test_wrong_passphrase_fails(self, sample_envelope):
         """Decryption with the wrong passphrase should raise InvalidTag."""
-        from cryptography.exceptions import InvalidTag
-
-        envelope = encrypt_content(SAMPLE_CONTENT, PASSPHRASE)
+        envelope = sample_envelope
         with pytest.raises(InvalidTag):
             decrypt_content(envelope, OTHER_PASSPHRASE)
 
@@ -191,53 +244,77 @@ class TestSecurityProperties:
         assert envelope1["iv"] != envelope2["iv"]
         assert envelope1["salt"] != envelope2["salt"]
 
-    def test_tampered_ciphertext_fails(self):
+    def test_tampered_ciphertext_fails(self, sample_envelope, content_key):
         """Modified ciphertext should fail authentication."""
-        import base64
+        envelope = dict(sample_envelope)
+        _tamper(envelope, "ciphertext")
 
-        from cryptography.exceptions import InvalidTag
-
-        envelope = encrypt_content(SAMPLE_CONTENT, PASSPHRASE)
+        with pytest.raises(InvalidTag):
+            decrypt_with_key(envelope, content_key[0])
 
-        # Tamper with ciphertext (flip a byte)
-        ct_bytes = base64.b64decode(envelope["ciphertext"])
-        tampered = bytes([ct_bytes[0] ^ 0xFF]) + ct_bytes[1:]
-        envelope["ciphertext"] = base64.b64encode(tampered).decode("ascii")
+    def test_tampered_tag_fails(self, sample_envelope, content_key):
+        """Modified authentication tag should fail."""
+        envelope = dict(sample_envelope)
+        _tamper(envelope, "tag")
 
         with pytest.raises(InvalidTag):
-            decrypt_content(envelope, PASSPHRASE)
+            decrypt_with_key(envelope, content_key[0])
 
-    def test_tampered_tag_fails(self):
-        """Modified authentication tag should fail."""
-        import base64
+    def test_tampered_iv_fails(self, sample_envelope, content_key):
+        """Modified IV should fail decryption (wrong nonce = wrong plaintext + auth fail)."""
+        envelope = dict(sample_envelope)
+        _tamper(envelope, "iv")
 
-        from cryptography.exceptions import InvalidTag
+        with pytest.raises(InvalidTag):
+            decrypt_with_key(envelope, content_key[0])
 
-        envelope = encrypt_content(SAMPLE_CONTENT, PASSPHRASE)
 
-        # Tamper with tag
-        tag_bytes = base64.b64decode(envelope["tag"])
-        tampered = bytes([tag_bytes[0] ^ 0xFF]) + tag_bytes[1:]
-        envelope["tag"] = base64.b64encode(tampered).decode("ascii")
+# -- Pre-derived keys ---------------------------------------------------------
 
-        with pytest.raises(InvalidTag):
-            decrypt_content(envelope, PASSPHRASE)
 
-    def test_tampered_iv_fails(self):
-        """Modified IV should fail decryption (wrong nonce = wrong plaintext + auth fail)."""
-        import base64
+class TestPreDerivedKey:
+    """Verify encrypt_with_key / decrypt_with_key (no per-call PBKDF2)."""
 
-        from cryptography.exceptions import InvalidTag
+    def test_roundtrip(self, content_key):
+        """Content encrypted with a key decrypts with the same key."""
+        key, salt = content_key
+        envelope = encrypt_with_key(SAMPLE_CONTENT, key, salt)
+        assert decrypt_with_key(envelope, key) == SAMPLE_CONTENT
 
-        envelope = encrypt_content(SAMPLE_CONTENT, PASSPHRASE)
+    def test_passphrase_still_decrypts(self, sample_envelope):
+        """Envelopes from a pre-derived key keep the passphrase path working."""
+        assert decrypt_content(sample_envelope, PASSPHRASE) == SAMPLE_CONTENT
 
-        # Tamper with IV
-        iv_bytes = base64.b64decode(envelope["iv"])
-        tampered = bytes([iv_bytes[0] ^ 0xFF]) + iv_bytes[1:]
-        envelope["iv"] = base64.b64encode(tampered).decode("ascii")
+    def test_fresh_iv_per_call(self, content_key):
+        """Reusing a key still draws a new IV for every envelope."""
+        key, salt = content_key
+        envelope1 = encrypt_with_key(SAMPLE_CONTENT, key, salt)
+        envelope2 = encrypt_with_key(SAMPLE_CONTENT, key, salt)
+        assert envelope1["iv"] != envelope2["iv"]
+        assert envelope1["salt"] == envelope2["salt"]
 
+    def test_wrong_key_fails(self, sample_envelope):
+        """A different key should fail authentication."""
         with pytest.raises(InvalidTag):
-            decrypt_content(envelope, PASSPHRASE)
+            decrypt_with_key(sample_envelope, bytes(crypto.KEY_BYTES))
+
+    @pytest.mark.parametrize("key_len, salt_len", [(16, 16), (32, 8)])
+    def test_bad_lengths_rejected(self, key_len, salt_len):
+        """Keys and salts of the wrong size raise ValueError."""
+        with pytest.raises(ValueError, match="bytes"):
+            encrypt_with_key(SAMPLE_CONTENT, bytes(key_len), bytes(salt_len))
+
+    def test_derive_key_matches_passphrase_path(self):
+        """A key derived from an envelope's salt decrypts that envelope."""
+        envelope = encrypt_content(SAMPLE_CONTENT, PASSPHRASE)
+        key = derive_key(PASSPHRASE, base64.b64decode(envelope["salt"]))
+        assert decrypt_with_key(envelope, key) == SAMPLE_CONTENT
+
+    @pytest.mark.parametrize("passphrase, salt_len", [("", 16), ("   ", 16), (PASSPHRASE, 8)])
+    def test_derive_key_rejects_bad_input(self, passphrase, salt_len):
+        """Empty passphrases and wrong-size salts raise ValueError."""
+        with pytest.raises(ValueError):
+            derive_key(passphrase, bytes(salt_len))
 
 
 # -- Key generation -----------------------------------------------------------
@@ -266,10 +343,10 @@ class TestKeyGeneration:
     def test_generate_key_is_url_safe(self):
         """Generated key should contain only URL-safe characters."""
         key = generate_key()
-        # URL-safe base64 uses: A-Z, a-z, 0-9, -, _
-        import re
-
-        assert re.match(r"^[A-Za-z0-9_-]+$", key), f"Key contains unsafe characters: {key}"
+        # URL-safe base64 uses: A-Z, a-z, 0-9, -, _ (deleting them must leave nothing)
+        assert key.encode("ascii").translate(None, _URL_SAFE_CHARS) == b"", (
+            f"Key contains unsafe characters: {key}"
+        )
 
 
 # -- Environment variable reading ---------------------------------------------
@@ -278,33 +355,31 @@ class TestKeyGeneration:
 class TestGetEncryptionKey:
     """Verify reading the encryption key from environment."""
 
-    def test_key_from_env(self):
+    def test_key_from_env(self, monkeypatch):
         """Should read CONTENT_ENCRYPTION_KEY from environment."""
-        with mock.patch.dict(os.environ, {ENV_VAR: "my-secret-key"}):
-            assert get_encryption_key() == "my-secret-key"
+        monkeypatch.setenv(ENV_VAR, "my-secret-key")
+        assert get_encryption_key() == "my-secret-key"
 
-    def test_key_not_set(self, tmp_path):
+    def test_key_not_set(self, no_encryption_key):
         """Should return None when env var is not set."""
-        with mock.patch.dict(os.environ, {}, clear=True), \
-             mock.patch("src.content.crypto._env_file_path", return_value=tmp_path / ".env"):
-            assert get_encryption_key() is None
+        assert get_encryption_key() is None
 
-    def test_key_empty_string(self, tmp_path):
+    def test_key_empty_string(self, tmp_path, monkeypatch):
         """Empty string should return None (not an empty key)."""
-        with mock.patch.dict(os.environ, {ENV_VAR: ""}), \
-             mock.patch("src.content.crypto._env_file_path", return_value=tmp_path / ".env"):
-            assert get_encryption_key() is None
+        monkeypatch.setenv(ENV_VAR, "")
+        monkeypatch.setattr("src.content.crypto._env_file_path", lambda: tmp_path / ".env")
+        assert get_encryption_key() is None
 
-    def test_key_whitespace_only(self, tmp_path):
+    def test_key_whitespace_only(self, tmp_path, monkeypatch):
         """Whitespace-only should return None."""
-        with mock.patch.dict(os.environ, {ENV_VAR: "   "}), \
-             mock.patch("src.content.crypto._env_file_path", return_value=tmp_path / ".env"):
-            assert get_encryption_key() is None
+        monkeypatch.setenv(ENV_VAR, "   ")
+        monkeypatch.setattr("src.content.crypto._env_file_path", lambda: tmp_path / ".env")
+        assert get_encryption_key() is None
 
-    def test_key_is_trimmed(self):
+    def test_key_is_trimmed(self, monkeypatch):
         """Key should be stripped of leading/trailing whitespace."""
-        with mock.patch.dict(os.environ, {ENV_VAR: "  my-key  "}):
-            assert get_encryption_key() == "my-key"
+        monkeypatch.setenv(ENV_VAR, "  my-key  ")
+        assert get_encryption_key() == "my-key"
 
 
 # -- Input validation ---------------------------------------------------------
@@ -323,9 +398,9 @@ class TestInputValidation:
         with pytest.raises(ValueError, match="empty"):
             encrypt_content(SAMPLE_CONTENT, "   ")
 
-    def test_decrypt_empty_passphrase(self):
+    def test_decrypt_empty_passphrase(self, sample_envelope):
         """Decrypting with empty passphrase should raise ValueError."""
-        envelope = encrypt_content(SAMPLE_CONTENT, PASSPHRASE)
+        envelope = sample_envelope
         with pytest.raises(ValueError, match="empty"):
             decrypt_content(envelope, "")
 
@@ -360,32 +435,37 @@ class TestInputValidation:
 class TestEnvelopeStructure:
     """Verify the encrypted envelope has the correct format."""
 
-    def test_envelope_has_required_fields(self):
+    def test_envelope_has_required_fields(self, sample_envelope):
         """Encrypted envelope should contain all required fields."""
-        envelope = encrypt_content(SAMPLE_CONTENT, PASSPHRASE)
+        envelope = sample_envelope
 
         assert envelope["encrypted"] is True
         assert envelope["version"] == 1
         assert envelope["algorithm"] == "aes-256-gcm"
         assert envelope["kdf"] == "pbkdf2-sha256"
-        assert envelope["kdf_iterations"] == 100_000
+        assert envelope["kdf_iterations"] == crypto.KDF_ITERATIONS
         assert "salt" in envelope
         assert "iv" in envelope
         assert "tag" in envelope
         assert "ciphertext" in envelope
 
-    def test_envelope_is_json_serializable(self):
+    def test_production_default_iterations(self):
+        """The shipped KDF cost is 100 000 (the suite lowers it for speed)."""
+        spec = importlib.util.spec_from_file_location("_crypto_defaults", crypto.__file__)
+        fresh = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(fresh)
+        assert fresh.KDF_ITERATIONS == 100_000
+
+    def test_envelope_is_json_serializable(self, sample_envelope):
         """Envelope should serialize to valid JSON."""
-        envelope = encrypt_content(SAMPLE_CONTENT, PASSPHRASE)
+        envelope = sample_envelope
         json_str = json.dumps(envelope)
         parsed = json.loads(json_str)
         assert parsed == envelope
 
-    def test_envelope_fields_are_base64(self):
+    def test_envelope_fields_are_base64(self, sample_envelope):
         """Binary fields should be valid base64 strings."""
-        import base64
-
-        envelope = encrypt_content(SAMPLE_CONTENT, PASSPHRASE)
+        envelope = sample_envelope
 
         for field in ("salt", "iv", "tag", "ciphertext"):
             value = envelope[field]
@@ -394,27 +474,21 @@ class TestEnvelopeStructure:
             decoded = base64.b64decode(value)
             assert len(decoded) > 0
 
-    def test_salt_length(self):
+    def test_salt_length(self, sample_envelope):
         """Salt should be 16 bytes."""
-        import base64
-
-        envelope = encrypt_content(SAMPLE_CONTENT, PASSPHRASE)
+        envelope = sample_envelope
         salt = base64.b64decode(envelope["salt"])
         assert len(salt) == 16
 
-    def test_iv_length(self):
+    def test_iv_length(self, sample_envelope):
         """IV should be 12 bytes (GCM standard)."""
-        import base64
-
-        envelope = encrypt_content(SAMPLE_CONTENT, PASSPHRASE)
+        envelope = sample_envelope
         iv = base64.b64decode(envelope["iv"])
         assert len(iv) == 12
 
-    def test_tag_length(self):
+    def test_tag_length(self, sample_envelope):
         """Tag should be 16 bytes (128-bit GCM tag)."""
-        import base64
-
-        envelope = encrypt_content(SAMPLE_CONTENT, PASSPHRASE)
+        envelope = sample_envelope
         tag = base64.b64decode(envelope["tag"])
         assert len(tag) == 16
 
@@ -433,35 +507,33 @@ class TestLoadArticle:
         result = load_article(path)
         assert result == SAMPLE_CONTENT
 
-    def test_load_encrypted_with_passphrase(self, tmp_path: Path):
+    def test_load_encrypted_with_passphrase(self, tmp_path: Path, sample_envelope):
         """Loading an encrypted article with passphrase should decrypt."""
         path = tmp_path / "test.json"
-        envelope = encrypt_content(SAMPLE_CONTENT, PASSPHRASE)
+        envelope = sample_envelope
         path.write_text(json.dumps(envelope))
 
         result = load_article(path, passphrase=PASSPHRASE)
         assert result == SAMPLE_CONTENT
 
-    def test_load_encrypted_from_env(self, tmp_path: Path):
+    def test_load_encrypted_from_env(self, tmp_path: Path, sample_envelope, monkeypatch):
         """Loading an encrypted article should read key from environment."""
         path = tmp_path / "test.json"
-        envelope = encrypt_content(SAMPLE_CONTENT, PASSPHRASE)
+        envelope = sample_envelope
         path.write_text(json.dumps(envelope))
 
-        with mock.patch.dict(os.environ, {ENV_VAR: PASSPHRASE}):
-            result = load_article(path)
+        monkeypatch.setenv(ENV_VAR, PASSPHRASE)
+        result = load_article(path)
         assert result == SAMPLE_CONTENT
 
-    def test_load_encrypted_no_key_raises(self, tmp_path: Path):
+    def test_load_encrypted_no_key_raises(self, tmp_path: Path, sample_envelope, no_encryption_key):
         """Loading encrypted article without key should raise ValueError."""
         path = tmp_path / "test.json"
-        envelope = encrypt_content(SAMPLE_CONTENT, PASSPHRASE)
+        envelope = sample_envelope
         path.write_text(json.dumps(envelope))
 
-        with mock.patch.dict(os.environ, {}, clear=True), \
-             mock.patch("src.content.crypto._env_file_path", return_value=tmp_path / ".env"):
-            with pytest.raises(ValueError, match="CONTENT_ENCRYPTION_KEY"):
-                load_article(path)
+        with pytest.raises(ValueError, match="CONTENT_ENCRYPTION_KEY"):
+            load_article(path)
 
     def test_load_missing_file(self, tmp_path: Path):
         """Loading a non-existent file should raise FileNotFoundError."""
@@ -494,22 +566,20 @@ class TestSaveArticle:
         result = decrypt_content(data, PASSPHRASE)
         assert result == SAMPLE_CONTENT
 
-    def test_save_encrypted_from_env(self, tmp_path: Path):
+    def test_save_encrypted_from_env(self, tmp_path: Path, monkeypatch):
         """Saving encrypted should read key from environment."""
         path = tmp_path / "test.json"
-        with mock.patch.dict(os.environ, {ENV_VAR: PASSPHRASE}):
-            save_article(path, SAMPLE_CONTENT, encrypt=True)
+        monkeypatch.setenv(ENV_VAR, PASSPHRASE)
+        save_article(path, SAMPLE_CONTENT, encrypt=True)
 
         data = json.loads(path.read_text())
         assert is_encrypted(data)
 
-    def test_save_encrypted_no_key_raises(self, tmp_path: Path):
+    def test_save_encrypted_no_key_raises(self, tmp_path: Path, no_encryption_key):
         """Saving encrypted without key should raise ValueError."""
         path = tmp_path / "test.json"
-        with mock.patch.dict(os.environ, {}, clear=True), \
-             mock.patch("src.content.crypto._env_file_path", return_value=tmp_path / ".env"):
-            with pytest.raises(ValueError, match="CONTENT_ENCRYPTION_KEY"):
-                save_article(path, SAMPLE_CONTENT, encrypt=True)
+        with pytest.raises(ValueError, match="CONTENT_ENCRYPTION_KEY"):
+            save_article(path, SAMPLE_CONTENT, encrypt=True)
 
     def test_save_creates_parent_dirs(self, tmp_path: Path):
         """Saving should create parent directories if needed."""
@@ -525,3 +595,13 @@ class TestSaveArticle:
         text = path.read_text()
         assert "\n" in text  # Indented, not single-line
         assert text.endswith("\n")  # Trailing newline
+
+    def test_save_writes_utf8(self, tmp_path: Path):
+        """Non-ASCII text should be written as UTF-8, not \\u escapes."""
+        path = tmp_path / "test.json"
+        content = {"blocks": [{"type": "paragraph", "data": {"text": "Café — 日本"}}]}
+        save_article(path, content)
+
+        raw = path.read_bytes()
+        assert "Café — 日本".encode() in raw
+        assert json.loads(raw) == content
@@ -8,9 +8,7 @@ handle encrypted articles alongside plaintext ones.
 from __future__ import annotations
 
 import json
-import os
 from pathlib import Path
-from unittest import mock
 
 import pytest
 
@@ -44,6 +42,8 @@ ENCRYPTED_ARTICLE_CONTENT = {
     ],
 }
 
+_PLAINTEXT_ARTICLE_JSON = json.dumps(PLAINTEXT_ARTICLE, indent=2).encode()
+
 
 # -- Helpers ------------------------------------------------------------------
 
@@ -55,29 +55,38 @@ def _setup_content_dir(tmp_path: Path) -> Path:
 
     # Plaintext article
     plaintext_path = articles_dir / "about.json"
-    plaintext_path.write_text(json.dumps(PLAINTEXT_ARTICLE, indent=2))
+    plaintext_path.write_bytes(_PLAINTEXT_ARTICLE_JSON)
 
     # Encrypted article
     envelope = encrypt_content(ENCRYPTED_ARTICLE_CONTENT, PASSPHRASE)
     encrypted_path = articles_dir / "disclosure.json"
-    encrypted_path.write_text(json.dumps(envelope, indent=2))
+    encrypted_path.write_bytes(json.dumps(envelope, indent=2).encode())
 
     return articles_dir
 
 
+@pytest.fixture(scope="session")
+def prebuilt_articles_dir(tmp_path_factory) -> Path:
+    """
+    Articles directory built once per session. ContentManager only reads
+    it, so tests share it directly instead of re-encrypting per test.
+    """
+    return _setup_content_dir(tmp_path_factory.mktemp("pipeline"))
+
+
 # -- ContentManager.list_articles tests ----------------------------------------
 
 
 class TestListArticles:
     """Verify list_articles detects encrypted articles."""
 
-    def test_lists_both_plaintext_and_encrypted(self, tmp_path: Path):
+    def test_lists_both_plaintext_and_encrypted(self, prebuilt_articles_dir: Path, monkeypatch):
         """Should list both article types with correct encrypted flag."""
-        articles_dir = _setup_content_dir(tmp_path)
+        articles_dir = prebuilt_articles_dir
         manager = ContentManager(content_dir=articles_dir)
 
-        with mock.patch.dict(os.environ, {ENV_VAR: PASSPHRASE}):
-            articles = manager.list_articles()
+        monkeypatch.setenv(ENV_VAR, PASSPHRASE)
+        articles = manager.list_articles()
 
         slugs = {a["slug"] for a in articles}
         assert "about" in slugs
@@ -89,56 +98,53 @@ class TestListArticles:
         assert about["encrypted"] is False
         assert disclosure["encrypted"] is True
 
-    def test_plaintext_title_extracted(self, tmp_path: Path):
+    def test_plaintext_title_extracted(self, prebuilt_articles_dir: Path, no_encryption_key):
         """Plaintext article title should come from first header block."""
-        articles_dir = _setup_content_dir(tmp_path)
+        articles_dir = prebuilt_articles_dir
         manager = ContentManager(content_dir=articles_dir)
 
-        with mock.patch.dict(os.environ, {}, clear=True):
-            articles = manager.list_articles()
+        articles = manager.list_articles()
 
         about = next(a for a in articles if a["slug"] == "about")
         assert about["title"] == "About Page"
 
-    def test_encrypted_title_with_key(self, tmp_path: Path):
+    def test_encrypted_title_with_key(self, prebuilt_articles_dir: Path, monkeypatch):
         """Encrypted article title should be extracted when key is available."""
-        articles_dir = _setup_content_dir(tmp_path)
+        articles_dir = prebuilt_articles_dir
         manager = ContentManager(content_dir=articles_dir)
 
-        with mock.patch.dict(os.environ, {ENV_VAR: PASSPHRASE}):
-            articles = manager.list_articles()
+        monkeypatch.setenv(ENV_VAR, PASSPHRASE)
+        articles = manager.list_articles()
 
         disclosure = next(a for a in articles if a["slug"] == "disclosure")
         assert disclosure["title"] == "Secret Disclosure"
 
-    def test_encrypted_title_without_key(self, tmp_path: Path):
+    def test_encrypted_title_without_key(self, prebuilt_articles_dir: Path, no_encryption_key):
         """Encrypted article should fall back to slug-based title without key."""
-        articles_dir = _setup_content_dir(tmp_path)
+        articles_dir = prebuilt_articles_dir
         manager = ContentManager(content_dir=articles_dir)
 
-        with mock.patch.dict(os.environ, {}, clear=True):
-            articles = manager.list_articles()
+        articles = manager.list_articles()
 
         disclosure = next(a for a in articles if a["slug"] == "disclosure")
         # Slug-based title: "disclosure" → "Disclosure"
         assert disclosure["title"] == "Disclosure"
         assert disclosure["encrypted"] is True
 
-    def test_encrypted_metadata_without_key(self, tmp_path: Path):
+    def test_encrypted_metadata_without_key(self, prebuilt_articles_dir: Path, no_encryption_key):
         """Encrypted article time/version should be None without key."""
-        articles_dir = _setup_content_dir(tmp_path)
+        articles_dir = prebuilt_articles_dir
         manager = ContentManager(content_dir=articles_dir)
 
-        with mock.patch.dict(os.environ, {}, clear=True):
-            articles = manager.list_articles()
+        articles = manager.list_articles()
 
         disclosure = next(a for a in articles if a["slug"] == "disclosure")
         assert disclosure["time"] is None
         assert disclosure["version"] is None
 
-    def test_plaintext_metadata_always_available(self, tmp_path: Path):
+    def test_plaintext_metadata_always_available(self, prebuilt_articles_dir: Path):
         """Plaintext article time/version should always be available."""
-        articles_dir = _setup_content_dir(tmp_path)
+        articles_dir = prebuilt_articles_dir
         manager = ContentManager(content_dir=articles_dir)
 
         articles = manager.list_articles()
@@ -167,9 +173,9 @@ class TestListArticles:
 class TestGetArticle:
     """Verify get_article transparently decrypts."""
 
-    def test_get_plaintext_article(self, tmp_path: Path):
+    def test_get_plaintext_article(self, prebuilt_articles_dir: Path):
         """Getting a plaintext article should work without a key."""
-        articles_dir = _setup_content_dir(tmp_path)
+        articles_dir = prebuilt_articles_dir
         manager = ContentManager(content_dir=articles_dir)
 
         article = manager.get_article("about")
@@ -181,13 +187,13 @@ class TestGetArticle:
         assert "<p>This is the about page.</p>" in article["html"]
         assert article["raw"] == PLAINTEXT_ARTICLE
 
-    def test_get_encrypted_article_with_key(self, tmp_path: Path):
+    def test_get_encrypted_article_with_key(self, prebuilt_articles_dir: Path, monkeypatch):
         """Getting an encrypted article with key should return decrypted content."""
-        articles_dir = _setup_content_dir(tmp_path)
+        articles_dir = prebuilt_articles_dir
         manager = ContentManager(content_dir=articles_dir)
 
-        with mock.patch.dict(os.environ, {ENV_VAR: PASSPHRASE}):
-            article = manager.get_article("disclosure")
+        monkeypatch.setenv(ENV_VAR, PASSPHRASE)
+        article = manager.get_article("disclosure")
 
         assert article is not None
         assert article["slug"] == "disclosure"
@@ -196,26 +202,44 @@ class TestGetArticle:
         assert "<p>Confidential content here.</p>" in article["html"]
         assert article["raw"] == ENCRYPTED_ARTICLE_CONTENT
 
-    def test_get_encrypted_article_no_key_raises(self, tmp_path: Path):
+    def test_get_encrypted_article_reads_file_once(
+        self, prebuilt_articles_dir: Path, monkeypatch
+    ):
+        """The envelope should be read and parsed once, not again for decryption."""
+        manager = ContentManager(content_dir=prebuilt_articles_dir)
+        reads = []
+        real_read_bytes = Path.read_bytes
+
+        def counting_read_bytes(self):
+            reads.append(self.name)
+            return real_read_bytes(self)
+
+        monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+        monkeypatch.setattr(Path, "read_text", lambda self, *a, **kw: pytest.fail("read_text"))
+        monkeypatch.setenv(ENV_VAR, PASSPHRASE)
+        article = manager.get_article("disclosure")
+
+        assert article["raw"] == ENCRYPTED_ARTICLE_CONTENT
+        assert reads.count("disclosure.json") == 1
+
+    def test_get_encrypted_article_no_key_raises(self, prebuilt_articles_dir: Path, no_encryption_key):
         """Getting an encrypted article without a key should raise ValueError."""
-        articles_dir = _setup_content_dir(tmp_path)
+        articles_dir = prebuilt_articles_dir
         manager = ContentManager(content_dir=articles_dir)
 
-        with mock.patch.dict(os.environ, {}, clear=True), \
-             mock.patch("src.content.crypto._env_file_path", return_value=tmp_path / ".env"):
-            with pytest.raises(ValueError, match="CONTENT_ENCRYPTION_KEY"):
-                manager.get_article("disclosure")
+        with pytest.raises(ValueError, match="CONTENT_ENCRYPTION_KEY"):
+            manager.get_article("disclosure")
 
-    def test_get_nonexistent_article(self, tmp_path: Path):
+    def test_get_nonexistent_article(self, prebuilt_articles_dir: Path):
         """Getting a non-existent article should return None."""
-        articles_dir = _setup_content_dir(tmp_path)
+        articles_dir = prebuilt_articles_dir
         manager = ContentManager(content_dir=articles_dir)
 
         assert manager.get_article("nonexistent") is None
 
-    def test_render_article_plaintext(self, tmp_path: Path):
+    def test_render_article_plaintext(self, prebuilt_articles_dir: Path):
         """render_article should work for plaintext articles."""
-        articles_dir = _setup_content_dir(tmp_path)
+        articles_dir = prebuilt_articles_dir
         manager = ContentManager(content_dir=articles_dir)
 
         html = manager.render_article("about")
@@ -224,13 +248,13 @@ class TestGetArticle:
         assert "<h1>About Page</h1>" in html
         assert "<p>This is the about page.</p>" in html
 
-    def test_render_article_encrypted(self, tmp_path: Path):
+    def test_render_article_encrypted(self, prebuilt_articles_dir: Path, monkeypatch):
         """render_article should decrypt and render encrypted articles."""
-        articles_dir = _setup_content_dir(tmp_path)
+        articles_dir = prebuilt_articles_dir
         manager = ContentManager(content_dir=articles_dir)
 
-        with mock.patch.dict(os.environ, {ENV_VAR: PASSPHRASE}):
-            html = manager.render_article("disclosure")
+        monkeypatch.setenv(ENV_VAR, PASSPHRASE)
+        html = manager.render_article("disclosure")
 
         assert html is not None
         assert "<h1>Secret Disclosure</h1>" in html
@@ -266,6 +266,14 @@ class TestFileSecurityProperties:
         with pytest.raises(ValueError):
             decrypt_file(truncated, PASSPHRASE)
 
+    def test_header_only_envelope_fails(self):
+        """An envelope cut right after the tag has no ciphertext."""
+        encrypted = encrypt_file(SAMPLE_TEXT_BYTES, SAMPLE_TEXT_NAME, SAMPLE_TEXT_MIME, PASSPHRASE)
+        header_only = encrypted[:len(encrypted) - len(SAMPLE_TEXT_BYTES)]
+
+        with pytest.raises(ValueError, match="no ciphertext"):
+            decrypt_file(header_only, PASSPHRASE)
+
     def test_no_size_overhead(self):
         """Binary format should have minimal size overhead (no base64 bloat)."""
         data = os.urandom(10000)
@@ -327,6 +335,11 @@ class TestFileInputValidation:
 class TestFileEnvelopeStructure:
     """Verify the binary envelope format."""
 
+    def test_envelope_is_exact_bytes_type(self):
+        """encrypt_file returns exactly bytes, not a subclass or bytearray."""
+        encrypted = encrypt_file(SAMPLE_TEXT_BYTES, SAMPLE_TEXT_NAME, SAMPLE_TEXT_MIME, PASSPHRASE)
+        assert type(encrypted) is bytes
+
     def test_starts_with_magic(self):
         """Encrypted file should start with COVAULT magic bytes."""
         encrypted = encrypt_file(SAMPLE_IMAGE_BYTES, SAMPLE_IMAGE_NAME, SAMPLE_IMAGE_MIME, PASSPHRASE)
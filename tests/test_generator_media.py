@@ -165,6 +165,22 @@ class TestProcessMedia:
         # doc_001 should be skipped
         assert "doc_001" not in media_map
 
+    def test_plaintext_media_copied_verbatim(self, media_workspace):
+        """Unencrypted media should be copied as-is, without a key."""
+        plain = b"PLAIN_PNG_DATA" * 1000
+        (media_workspace["content_dir"] / "img_001.enc").write_bytes(plain)
+
+        generator = SiteGenerator(output_dir=media_workspace["output_dir"])
+
+        with mock.patch(
+            "src.content.media.MediaManifest._default_path",
+            return_value=media_workspace["manifest_path"],
+        ), mock.patch.dict(os.environ, {"CONTENT_ENCRYPTION_KEY": PASSPHRASE}):
+            media_map = generator._process_media("OK")
+
+        img_path = media_workspace["output_dir"] / media_map["img_001"]
+        assert img_path.read_bytes() == plain
+
     def test_empty_manifest_returns_empty_map(self, tmp_path):
         """Empty manifest should return empty map."""
         content_dir = tmp_path / "content" / "media"
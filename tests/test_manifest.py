@@ -13,6 +13,7 @@ from src.site.manifest import (
     ArticleVisibility,
     ArticleMeta,
     DefaultVisibility,
+    Stage,
     StageBehavior,
     STAGE_ORDER,
 )
@@ -34,6 +35,12 @@ class TestStageOrder:
         expected = ["OK", "REMIND_1", "REMIND_2", "PRE_RELEASE", "PARTIAL", "FULL"]
         for stage in expected:
             assert stage in STAGE_ORDER
+    
+    def test_stage_order_matches_enum(self):
+        """Test the name lookup yields Stage members with the same values."""
+        assert STAGE_ORDER["PARTIAL"] is Stage.PARTIAL
+        assert STAGE_ORDER["PARTIAL"] == 40
+        assert list(STAGE_ORDER) == [s.name for s in Stage]
 
 
 class TestArticleVisibility:
@@ -206,7 +213,16 @@ class TestContentManifest:
         nav_full = sample_manifest.get_nav_articles("FULL")
         slugs = [a.slug for a in nav_full]
         assert "disclosure" not in slugs
-    
+
+    def test_stage_queries_are_cached(self, sample_manifest):
+        """Test repeated queries for a stage reuse the computed list."""
+        visible = sample_manifest.get_visible_articles("PARTIAL")
+        assert sample_manifest.get_visible_articles("PARTIAL") is visible
+        assert sample_manifest.get_visible_articles("FULL") is not visible
+
+        nav = sample_manifest.get_nav_articles("PARTIAL")
+        assert sample_manifest.get_nav_articles("PARTIAL") is nav
+
     def test_empty_manifest(self):
         """Test empty manifest creation."""
         manifest = ContentManifest._empty()
@@ -293,3 +309,47 @@ class TestManifestLoading:
         assert article is not None
         assert article.title == "minimal"  # Uses slug as title
         assert article.visibility.min_stage == "FULL"  # Default
+    
+    def test_auto_discovers_unlisted_articles(self, tmp_path):
+        """Test article files missing from the manifest are picked up."""
+        articles_dir = tmp_path / "articles"
+        articles_dir.mkdir()
+        for name in ("listed.json", "zeta_notes.json", "alpha-brief.json", "readme.txt"):
+            (articles_dir / name).write_text("{}")
+        (articles_dir / "nested.json").mkdir()
+        
+        manifest_data = {
+            "articles": [{"slug": "listed", "title": "Listed"}],
+            "defaults": {"min_stage": "PARTIAL"},
+        }
+        manifest = ContentManifest._from_dict(
+            manifest_data, manifest_path=tmp_path / "manifest.yaml"
+        )
+        
+        assert [a.slug for a in manifest.articles] == ["listed", "alpha-brief", "zeta_notes"]
+        alpha = manifest.get_article("alpha-brief")
+        assert alpha.title == "Alpha Brief"
+        assert alpha.visibility.min_stage == "PARTIAL"
+        assert alpha.visibility.include_in_nav is True
+    
+    def test_null_sections_use_defaults(self):
+        """Test empty visibility/meta/defaults sections fall back to defaults."""
+        manifest = ContentManifest._from_dict({
+            "articles": [{"slug": "bare", "visibility": None, "meta": None}],
+            "defaults": None,
+        })
+        article = manifest.get_article("bare")
+        assert article.visibility.min_stage == "FULL"
+        assert article.meta.tags == []
+        assert manifest.defaults.min_stage == "FULL"
+    
+    def test_titles_sorted_case_insensitively(self):
+        """Test listing order ignores title case after pinning."""
+        manifest = ContentManifest._from_dict({
+            "articles": [
+                {"slug": "b", "title": "beta", "visibility": {"min_stage": "OK"}},
+                {"slug": "a", "title": "Alpha", "visibility": {"min_stage": "OK"}},
+                {"slug": "z", "title": "Zulu", "visibility": {"min_stage": "OK", "pin_to_top": True}},
+            ],
+        })
+        assert [a.slug for a in manifest.get_visible_articles("OK")] == ["z", "a", "b"]
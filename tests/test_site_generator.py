@@ -2,6 +2,7 @@
 Tests for the Site Generator.
 """
 
+import os
 import pytest
 from pathlib import Path
 import tempfile
@@ -155,15 +156,78 @@ class TestSiteGeneratorBuild:
         # Old file should still exist
         assert old_file.exists()
     
+    def test_incremental_build_skips_unchanged_files(self, sample_state, temp_output_dir):
+        """Test clean=False leaves files with identical content untouched."""
+        generator = SiteGenerator(output_dir=temp_output_dir)
+        generator.build(sample_state)
+        
+        robots = temp_output_dir / "robots.txt"
+        os.utime(robots, ns=(0, 0))
+        
+        result = generator.build(sample_state, clean=False)
+        
+        assert robots.stat().st_mtime_ns == 0
+        assert result["files_written"] < result["files_generated"]
+    
+    def test_incremental_build_removes_stale_outputs(self, sample_state, temp_output_dir):
+        """Test clean=False removes outputs the new build no longer produces."""
+        generator = SiteGenerator(output_dir=temp_output_dir)
+        generator.build(sample_state, audit_entries=[{"tick_id": "T-1"}])
+        archive_page = temp_output_dir / "archive" / "T-1.html"
+        assert archive_page.exists()
+        
+        generator.build(sample_state, clean=False)
+        
+        assert not archive_page.exists()
+    
+    def test_build_timestamp_matches_page_footer(self, sample_state, temp_output_dir):
+        """Test the result timestamp is the same one rendered into pages."""
+        generator = SiteGenerator(output_dir=temp_output_dir)
+        result = generator.build(sample_state)
+        
+        index_content = (temp_output_dir / "index.html").read_text()
+        assert f"Generated: {result['timestamp']}" in index_content
+    
+    def test_rebuild_picks_up_changed_css(self, sample_state, temp_output_dir):
+        """Test the cached stylesheets are reloaded when a source file changes."""
+        template_dir = temp_output_dir / "templates"
+        shutil.copytree(SiteGenerator(temp_output_dir)._default_template_dir(), template_dir)
+        output = temp_output_dir / "public"
+        
+        generator = SiteGenerator(output_dir=output, template_dir=template_dir)
+        generator.build(sample_state)
+        
+        (template_dir / "css" / "base.css").write_text("/* changed */")
+        generator.build(sample_state, clean=False)
+        
+        assert (output / "assets" / "css" / "base.css").read_text() == "/* changed */"
+    
+    def test_build_without_full_state_skips_status_page(self, sample_state, temp_output_dir):
+        """Test include_full_state=False omits status.html and its link."""
+        generator = SiteGenerator(output_dir=temp_output_dir)
+        generator.build(sample_state, include_full_state=False)
+        
+        assert not (temp_output_dir / "status.html").exists()
+        assert 'href="status.html"' not in (temp_output_dir / "index.html").read_text()
+    
     def test_build_result_structure(self, sample_state, temp_output_dir):
         """Test build result has expected structure."""
         generator = SiteGenerator(output_dir=temp_output_dir)
-        result = generator.build(sample_state)
+        result = generator.build(sample_state, include_file_list=True)
         
         assert "files_generated" in result
         assert "files" in result
         assert "timestamp" in result
         assert isinstance(result["files"], list)
+        assert len(result["files"]) == result["files_generated"]
+    
+    def test_build_result_omits_file_list_by_default(self, sample_state, temp_output_dir):
+        """Test the path list is opt-in; the count is always present."""
+        generator = SiteGenerator(output_dir=temp_output_dir)
+        result = generator.build(sample_state)
+        
+        assert "files" not in result
+        assert result["files_generated"] > 0
 
 
 class TestSiteGeneratorContext:
@@ -215,6 +279,21 @@ class TestSiteGeneratorContext:
         assert len(context["audit_entries"]) == 2
 
 
+    def test_integration_executions_newest_twenty(self, sample_state, temp_output_dir):
+        """Test only the 20 most recent executions are kept, newest first."""
+        generator = SiteGenerator(output_dir=temp_output_dir)
+        
+        audit_entries = []
+        for i in range(25):
+            audit_entries.append({"event_type": "tick_start", "tick_id": f"T-{i}"})
+            audit_entries.append({"event_type": "action_executed", "tick_id": f"T-{i}"})
+        
+        context = generator._build_context(sample_state, audit_entries)
+        
+        ticks = [e["tick_id"] for e in context["integration_executions"]]
+        assert ticks == [f"T-{i}" for i in range(24, 4, -1)]
+
+
 class TestSiteGeneratorOutput:
     """Tests for generated output content."""
     
@@ -252,6 +331,41 @@ class TestSiteGeneratorOutput:
         assert "renewal" in countdown_content.lower()
         assert "github" in countdown_content.lower()
     
+    def test_archive_and_feed_escape_entry_values(self, sample_state, temp_output_dir):
+        """Test hand-built pages escape audit entry values."""
+        sample_state.meta.project = "A & B"
+        entry = {"tick_id": "T-1", "new_state": "<script>x</script>"}
+        
+        generator = SiteGenerator(output_dir=temp_output_dir)
+        generator.build(sample_state, audit_entries=[entry])
+        
+        archive_content = (temp_output_dir / "archive" / "T-1.html").read_text()
+        assert "<script>x" not in archive_content
+        assert "&lt;script&gt;x" in archive_content
+        
+        feed_content = (temp_output_dir / "feed.xml").read_text()
+        assert "<script>x" not in feed_content
+        assert "A &amp; B" in feed_content
+    
+    def test_archive_filename_is_sanitized(self, sample_state, temp_output_dir):
+        """Test archive page names cannot escape the archive directory."""
+        generator = SiteGenerator(output_dir=temp_output_dir)
+        generator.build(sample_state, audit_entries=[{"tick_id": "../T 1:x"}])
+        
+        assert (temp_output_dir / "archive" / "___T_1_x.html").exists()
+    
+    def test_inline_css_only_on_pages_that_define_it(self, sample_state, temp_output_dir):
+        """Test the inline <style> block is emitted only where a page fills it."""
+        generator = SiteGenerator(output_dir=temp_output_dir)
+        generator.build(sample_state)
+        
+        countdown_content = (temp_output_dir / "countdown.html").read_text()
+        assert "--color-stage: #10b981" in countdown_content
+        
+        index_content = (temp_output_dir / "index.html").read_text()
+        assert "<style>" not in index_content
+        assert "% block" not in index_content
+    
     def test_output_is_valid_html(self, sample_state, temp_output_dir):
         """Test generated files are valid HTML."""
         generator = SiteGenerator(output_dir=temp_output_dir)
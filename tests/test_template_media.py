@@ -0,0 +1,326 @@
+"""
+Tests for src.templates.media — Media markdown rendering helpers.
+
+Covers:
+- Alt-text prefix dispatch (image / video / audio / file)
+- Plain-text labels for SMS and X adapters
+- Email HTML rendering
+- Site base URL caching (TTL, stale fallback, retry backoff)
+- Media manifest reuse across calls
+- Cloudflare API keep-alive connection reuse
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import os
+
+import pytest
+
+from src.content.media import MediaManifest
+from src.templates import media
+from src.templates.media import media_md_to_html, strip_media_to_labels
+
+
+class TestStripMediaToLabels:
+    @pytest.mark.parametrize(
+        "markdown, expected",
+        [
+            ("![cat](https://x/a.jpg)", "[📸 cat]"),
+            ("![](https://x/a.jpg)", "[📸 image]"),
+            ("![video: demo](https://x/a.mp4)", "[🎬 demo]"),
+            ("![VIDEO:demo](https://x/a.mp4)", "[🎬 demo]"),
+            ("![audio: ](https://x/a.mp3)", "[🎵 audio]"),
+            ("![file: report.pdf](https://x/r.pdf)", "[📎 report.pdf]"),
+            ("![FILE:a](https://x/a.bin)", "[📎 a]"),
+            ("![videos of cats](https://x/c.jpg)", "[📸 videos of cats]"),
+            ("![ file:  notes.txt ](https://x/n.txt)", "[📎 notes.txt]"),
+        ],
+    )
+    def test_labels(self, markdown, expected):
+        assert strip_media_to_labels(markdown) == expected
+
+    def test_surrounding_text_kept(self):
+        text = "Before ![video: clip](https://x/v.mp4) after"
+        assert strip_media_to_labels(text) == "Before [🎬 clip] after"
+
+
+class TestMediaMdToHtml:
+    def test_image(self):
+        html = media_md_to_html("![Chart](https://x/c.png)")
+        assert '<img src="https://x/c.png" alt="Chart"' in html
+        assert "font-style:italic;\">Chart</div>" in html
+
+    def test_image_without_alt_has_no_caption(self):
+        html = media_md_to_html("![](https://x/c.png)")
+        assert 'alt="Image"' in html
+        assert "font-style:italic" not in html
+
+    def test_video_default_caption(self):
+        html = media_md_to_html("![video:](https://x/v.mp4)")
+        assert "🎬 Video</a>" in html
+        assert 'href="https://x/v.mp4"' in html
+
+    def test_audio(self):
+        html = media_md_to_html("![Audio: Interview](https://x/a.mp3)")
+        assert "🎵 Interview</a>" in html
+
+    def test_file(self):
+        html = media_md_to_html("![file: data.csv](https://x/d.csv)")
+        assert "📎 data.csv</a>" in html
+
+
+class TestSiteBaseUrlCache:
+    @pytest.fixture(autouse=True)
+    def _isolated(self, monkeypatch):
+        media._reset_site_base_url_cache()
+        monkeypatch.delenv("GITHUB_REPOSITORY", raising=False)
+        monkeypatch.setattr(media, "_read_tunnel_cache", lambda: None)
+        monkeypatch.setattr(media, "_write_tunnel_cache", lambda url: None)
+        self.clock = [1000.0]
+        monkeypatch.setattr(media.time, "time", lambda: self.clock[0])
+        yield
+        media._reset_site_base_url_cache()
+
+    def _detector(self, monkeypatch, results):
+        calls = []
+
+        def detect():
+            calls.append(1)
+            return results.pop(0)
+
+        monkeypatch.setattr(media, "_detect_cloudflare_tunnel_url", detect)
+        return calls
+
+    def test_resolved_once_within_ttl(self, monkeypatch):
+        calls = self._detector(monkeypatch, ["https://t.example/"])
+        assert media.get_site_base_url() == "https://t.example"
+        assert media.get_site_base_url() == "https://t.example"
+        assert len(calls) == 1
+
+    def test_stale_value_served_when_refresh_fails(self, monkeypatch):
+        calls = self._detector(monkeypatch, ["https://t.example", None])
+        assert media.get_site_base_url() == "https://t.example"
+        self.clock[0] += media._TUNNEL_CACHE_TTL + 1
+        assert media.get_site_base_url() == "https://t.example"
+        assert len(calls) == 2
+
+    def test_failed_detection_backs_off(self, monkeypatch):
+        monkeypatch.setenv("GITHUB_REPOSITORY", "owner/repo")
+        calls = self._detector(monkeypatch, [None, "https://t.example"])
+        assert media.get_site_base_url() == "https://owner.github.io/repo"
+        assert media.get_site_base_url() == "https://owner.github.io/repo"
+        assert len(calls) == 1
+        self.clock[0] += media._TUNNEL_RETRY_BACKOFF + 1
+        assert media.get_site_base_url() == "https://t.example"
+
+    def test_negative_result_cached_without_repeat_warnings(self, monkeypatch, caplog):
+        self._detector(monkeypatch, [None])
+        reads = []
+        monkeypatch.setattr(media, "_read_tunnel_cache", lambda: reads.append(1))
+        with caplog.at_level("WARNING", logger=media.logger.name):
+            assert media.get_site_base_url() is None
+            assert media.get_site_base_url() is None
+        assert len(reads) == 1
+        assert len(caplog.records) == 1
+
+
+class _FakeResponse:
+    def __init__(self, status, payload):
+        self.status = status
+        self._body = json.dumps(payload).encode()
+
+    def read(self):
+        return self._body
+
+
+class _FakeConnection:
+    instances: list = []
+
+    def __init__(self, host, timeout=None):
+        self.host = host
+        self.requests = []
+        self.fail_next = False
+        self.closed = False
+        _FakeConnection.instances.append(self)
+
+    def request(self, method, path, headers=None):
+        if self.fail_next:
+            self.fail_next = False
+            raise http.client.RemoteDisconnected("closed")
+        self.requests.append((method, path, headers["Authorization"]))
+
+    def getresponse(self):
+        return _FakeResponse(200, {
+            "success": True,
+            "result": {"config": {"ingress": [{"hostname": "t.example"}]}},
+        })
+
+    def close(self):
+        self.closed = True
+
+
+class TestCloudflareApiConnection:
+    @pytest.fixture(autouse=True)
+    def _fake_http(self, monkeypatch):
+        _FakeConnection.instances = []
+        monkeypatch.setattr(http.client, "HTTPSConnection", _FakeConnection)
+        monkeypatch.setattr(media, "_cf_api_conn", None)
+
+    def test_connection_reused(self):
+        assert media._query_cloudflare_tunnel_hostname("acc", "tun", "tok1") == "https://t.example"
+        assert media._query_cloudflare_tunnel_hostname("acc", "tun", "tok2") == "https://t.example"
+        (conn,) = _FakeConnection.instances
+        assert conn.host == "api.cloudflare.com"
+        assert conn.requests == [
+            ("GET", "/client/v4/accounts/acc/cfd_tunnel/tun/configurations", "Bearer tok1"),
+            ("GET", "/client/v4/accounts/acc/cfd_tunnel/tun/configurations", "Bearer tok2"),
+        ]
+        assert media._last_api_status == 200
+
+    def test_stale_connection_replaced(self):
+        media._query_cloudflare_tunnel_hostname("acc", "tun", "tok")
+        _FakeConnection.instances[0].fail_next = True
+        assert media._query_cloudflare_tunnel_hostname("acc", "tun", "tok") == "https://t.example"
+        first, second = _FakeConnection.instances
+        assert first.closed
+        assert len(second.requests) == 1
+
+
+class TestTunnelDiskCache:
+    @pytest.fixture(autouse=True)
+    def _project_root(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PROJECT_ROOT", str(tmp_path))
+        self.root = tmp_path
+
+    def test_round_trip(self):
+        media._write_tunnel_cache("https://t.example")
+        assert media._read_tunnel_cache() == "https://t.example"
+
+    def test_write_is_atomic_and_skips_identical_url(self):
+        media._write_tunnel_cache("https://t.example")
+        cache = self.root / "state" / ".tunnel_cache.json"
+        before = cache.read_text()
+
+        media._write_tunnel_cache("https://t.example")
+        assert cache.read_text() == before
+        assert list(cache.parent.iterdir()) == [cache]
+
+        media._write_tunnel_cache("https://other.example")
+        assert media._read_tunnel_cache() == "https://other.example"
+
+    def test_missing_or_expired(self):
+        assert media._read_tunnel_cache() is None
+        cache = self.root / "state" / ".tunnel_cache.json"
+        cache.parent.mkdir()
+        cache.write_text(json.dumps({"url": "https://t.example", "ts": 0}))
+        assert media._read_tunnel_cache() is None
+
+
+class TestManifestCache:
+    @pytest.fixture(autouse=True)
+    def _isolated(self, tmp_path, monkeypatch):
+        self.path = tmp_path / "manifest.json"
+        self.path.write_text(json.dumps({"version": 1, "media": []}))
+        monkeypatch.setattr(MediaManifest, "_default_path", classmethod(lambda cls: self.path))
+        media._reset_manifest_cache()
+        yield
+        media._reset_manifest_cache()
+
+    def test_reused_until_file_changes(self):
+        first = media._load_manifest()
+        assert media._load_manifest() is first
+
+        stat = self.path.stat()
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert media._load_manifest() is not first
+
+
+class TestResolveMediaUris:
+    @pytest.fixture
+    def lookups(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(media, "get_site_base_url", lambda: calls.append("url") or None)
+        monkeypatch.setattr(media, "_load_manifest", lambda: calls.append("manifest"))
+        return calls
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Plain text",
+            "Docs mention media://img_001 in prose",
+            "See media:// and ![pic](https://x/a.png)",
+        ],
+    )
+    def test_no_media_reference_skips_lookups(self, lookups, text):
+        assert media.resolve_media_uris(text) is text
+        assert lookups == []
+
+    def test_media_reference_triggers_lookups(self, lookups):
+        out = media.resolve_media_uris("![video: clip](media://vid_001)")
+        assert out == "[🎬 clip]"
+        assert lookups == ["url", "manifest"]
+
+    def test_repeated_media_id_looked_up_once(self, monkeypatch):
+        looked_up = []
+
+        class Entry:
+            original_name = "clip.mp4"
+
+            def is_visible_at(self, stage):
+                return stage == "FULL"
+
+        class Manifest:
+            def get(self, media_id):
+                looked_up.append(media_id)
+                return Entry() if media_id == "vid_001" else None
+
+        monkeypatch.setattr(media, "get_site_base_url", lambda: "https://site.example")
+        monkeypatch.setattr(media, "_load_manifest", lambda: Manifest())
+
+        text = (
+            "![video: a](media://vid_001) ![video: b](media://vid_001) "
+            "![gone](media://img_404)"
+        )
+        assert media.resolve_media_uris(text, stage="FULL") == (
+            "![video: a](https://site.example/media/clip.mp4) "
+            "![video: b](https://site.example/media/clip.mp4) [📸 gone]"
+        )
+        assert looked_up == ["vid_001", "img_404"]
+
+        assert media.resolve_media_uris(text, stage="PARTIAL") == "[🎬 a] [🎬 b] [📸 gone]"
+
+
+class TestMediaMdRe:
+    def test_alt_text_cannot_span_lines(self):
+        text = "![not\nmedia](https://x/a.png)"
+        assert strip_media_to_labels(text) == text
+
+    def test_url_cannot_contain_whitespace(self):
+        text = "![pic](https://x/a b.png)"
+        assert strip_media_to_labels(text) == text
+
+    def test_adjacent_references(self):
+        text = "!![a](https://x/1.png)![b](https://x/2.png)"
+        assert strip_media_to_labels(text) == "![📸 a][📸 b]"
+
+    def test_public_pattern_name_still_importable(self):
+        from src.templates.media import MEDIA_MD_RE
+
+        assert MEDIA_MD_RE is media._media_re()
+        assert MEDIA_MD_RE.findall("![a](https://x/1.png)") == [("a", "https://x/1.png")]
+
+    def test_no_regex_compiled_on_import(self):
+        import importlib.util
+
+        spec = importlib.util.find_spec("src.templates.media")
+        fresh = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(fresh)
+        assert fresh._MEDIA_MD_RE is None
+        assert fresh._MEDIA_URI_MD_RE is None
+
+    def test_text_without_media_returned_as_is(self):
+        text = "No media here, just [a link](https://x) and ! marks"
+        assert strip_media_to_labels(text) is text
+        assert media_md_to_html(text) is text
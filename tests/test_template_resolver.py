@@ -0,0 +1,146 @@
+"""
+Tests for src.templates.resolver — Template lookup and ${{var}} rendering.
+
+Covers:
+- Variable substitution (flat, dotted dict paths, object attributes)
+- Missing variables render as empty string
+- Template resolution order (subdirectory, extension, .enc first)
+- Compiled templates match render() and are reused until the file changes
+"""
+
+from __future__ import annotations
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from src.templates.resolver import TemplateResolver
+
+
+@pytest.fixture
+def resolver(tmp_path):
+    return TemplateResolver(tmp_path)
+
+
+class TestRender:
+    def test_flat_and_dotted_variables(self, resolver):
+        context = {"stage": "PARTIAL", "meta": {"project": "Orchestrator"}}
+        out = resolver.render("${{meta.project}} is at ${{ stage }}.", context)
+        assert out == "Orchestrator is at PARTIAL."
+
+    def test_object_attributes(self, resolver):
+        context = {"timer": SimpleNamespace(deadline_iso="2026-01-01T00:00:00Z")}
+        assert resolver.render("Due ${{timer.deadline_iso}}", context) == "Due 2026-01-01T00:00:00Z"
+
+    def test_missing_variable_renders_empty(self, resolver):
+        context = {"meta": {"project": "X"}, "timer": SimpleNamespace()}
+        out = resolver.render("[${{nope}}][${{meta.missing}}][${{timer.missing}}]", context)
+        assert out == "[][][]"
+
+    def test_non_string_values(self, resolver):
+        assert resolver.render("${{count}} / ${{ok}}", {"count": 3, "ok": False}) == "3 / False"
+
+    def test_text_without_variables_unchanged(self, resolver):
+        text = "Plain $ text with {braces} and ${single}"
+        assert resolver.render(text, {}) == text
+
+
+class TestCompiledTemplate:
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "",
+            "no variables",
+            "${{stage}}",
+            "${{ meta.project }} at ${{stage}}${{stage}} [${{missing.path}}] ${{timer.deadline_iso}}",
+            "trailing ${{count}} text $",
+        ],
+    )
+    def test_matches_render(self, resolver, template):
+        context = {
+            "stage": "FULL",
+            "count": 0,
+            "meta": {"project": "P"},
+            "timer": SimpleNamespace(deadline_iso="D"),
+        }
+        assert resolver.compile(template).render(context) == resolver.render(template, context)
+
+    def test_load_compiled_reused_until_mtime_changes(self, tmp_path, resolver):
+        path = tmp_path / "notice.md"
+        path.write_text("v1 ${{x}}")
+        first = resolver.load_compiled("notice")
+        assert resolver.load_compiled("notice") is first
+        assert resolver.resolve_and_render("notice", {"x": 1}) == "v1 1"
+
+        path.write_text("v2 ${{x}}")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert resolver.resolve_and_render("notice", {"x": 2}) == "v2 2"
+
+
+class TestResolve:
+    def test_search_order_and_extensions(self, tmp_path, resolver):
+        (tmp_path / "public").mkdir()
+        (tmp_path / "operator").mkdir()
+        (tmp_path / "public" / "notice.md").write_text("public")
+        (tmp_path / "notice.md").write_text("root")
+        (tmp_path / "operator" / "notice.txt").write_text("operator")
+
+        assert resolver.resolve("notice") == tmp_path / "operator" / "notice.txt"
+
+    def test_encrypted_variant_preferred(self, tmp_path, resolver):
+        (tmp_path / "alert.md").write_text("plain")
+        (tmp_path / "alert.md.enc").write_bytes(b"COVAULT")
+        assert resolver.resolve("alert") == tmp_path / "alert.md.enc"
+
+    def test_missing_template(self, resolver):
+        assert resolver.resolve("absent") is None
+        assert resolver.resolve_and_render("absent", {}) is None
+
+    def test_resolve_and_render(self, tmp_path, resolver):
+        (tmp_path / "hello.md").write_text("Hi ${{name}}", encoding="utf-8")
+        assert resolver.resolve_and_render("hello", {"name": "Ana"}) == "Hi Ana"
+
+    def test_subscribers_directory_searched(self, tmp_path, resolver):
+        """Templates saved by the admin UI under subscribers/ are found."""
+        (tmp_path / "subscribers").mkdir()
+        (tmp_path / "subscribers" / "digest.md").write_text("x")
+        (tmp_path / "digest.md").write_text("root")
+        assert resolver.resolve("digest") == tmp_path / "subscribers" / "digest.md"
+
+    def test_resolution_cached_until_cleared(self, tmp_path, resolver):
+        assert resolver.resolve("late") is None
+        (tmp_path / "late.md").write_text("x")
+        assert resolver.resolve("late") is None
+
+        resolver.clear_cache()
+        assert resolver.resolve("late") == tmp_path / "late.md"
+
+    def test_nested_template_name(self, tmp_path, resolver):
+        (tmp_path / "public" / "alerts").mkdir(parents=True)
+        (tmp_path / "public" / "alerts" / "urgent.md").write_text("x")
+        assert resolver.resolve("alerts/urgent") == tmp_path / "public" / "alerts" / "urgent.md"
+
+    def test_each_directory_listed_once(self, tmp_path, resolver, monkeypatch):
+        import src.templates.resolver as resolver_mod
+
+        (tmp_path / "a.md").write_text("x")
+        scanned = []
+        real_scandir = resolver_mod.os.scandir
+
+        def counting_scandir(path):
+            scanned.append(path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(resolver_mod.os, "scandir", counting_scandir)
+        assert resolver.resolve("a") == tmp_path / "a.md"
+        assert resolver.resolve("b") is None
+        # One scandir per search directory (missing ones included), not per lookup
+        assert len(scanned) == len(TemplateResolver.SEARCH_ORDER)
+        assert scanned[-1] == tmp_path
+
+    def test_read_without_instance(self, tmp_path):
+        path = tmp_path / "notice.md"
+        path.write_text("Hello ${{name}}", encoding="utf-8")
+        assert TemplateResolver.read(path) == "Hello ${{name}}"
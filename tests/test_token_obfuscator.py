@@ -14,7 +14,7 @@ import re
 
 import pytest
 
-from src.site.token_obfuscator import obfuscate_token
+from src.site.token_obfuscator import _xor_bytes, obfuscate_token
 
 
 # ── Fixtures ──────────────────────────────────────────────────────
@@ -143,3 +143,14 @@ class TestTokenObfuscation:
         token = "ghp_" + "A" * 36
         result = obfuscate_token(token)
         assert _simulate_js_reassembly(result) == token
+
+    def test_xor_equal_length_matches_bytewise(self):
+        """The big-int fast path agrees with a plain per-byte XOR."""
+        data = b"\x00ghp_token\xff"
+        key = bytes(range(len(data)))
+        expected = bytes(d ^ k for d, k in zip(data, key))
+        assert _xor_bytes(data, key) == expected
+        assert _xor_bytes(expected, key) == data
+
+    def test_xor_cycles_shorter_key(self):
+        assert _xor_bytes(b"\x01\x02\x03", b"\x01") == b"\x00\x03\x02"
@@ -70,6 +70,19 @@ class TestValidateFile:
             validate_file_readable(tmp_path, "Test file")
         assert "not a file" in str(exc_info.value)
 
+    def test_unreadable_file_fails(self, tmp_path, monkeypatch):
+        """Permission errors on open are reported as not readable."""
+        test_file = tmp_path / "locked.txt"
+        test_file.write_text("content")
+
+        def deny(self, *args, **kwargs):
+            raise PermissionError("denied")
+
+        monkeypatch.setattr(Path, "open", deny)
+        with pytest.raises(ValidationError) as exc_info:
+            validate_file_readable(test_file, "Test file")
+        assert "not readable" in str(exc_info.value)
+
 
 class TestValidateJson:
     """Tests for JSON file validation."""
@@ -93,6 +106,19 @@ class TestValidateJson:
             validate_json_file(json_file, "Test JSON")
         assert "Invalid JSON" in str(exc_info.value)
 
+    @pytest.mark.parametrize(
+        "make_path, message",
+        [
+            (lambda d: d / "missing.json", "does not exist"),
+            (lambda d: d, "is not a file"),
+        ],
+    )
+    def test_open_errors(self, tmp_path, make_path, message):
+        """Missing files and directories keep their specific messages."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_json_file(make_path(tmp_path), "Test JSON")
+        assert message in str(exc_info.value)
+
 
 class TestValidateStateFile:
     """Tests for state file validation."""
@@ -155,6 +181,19 @@ class TestValidatePolicyDir:
         assert "states" in result
         assert "rules" in result
         assert "plans" in result
+        assert result["default_plan"] == plans_dir / "default.yaml"
+
+    def test_plans_dir_without_yaml_fails(self, tmp_path):
+        """A plans directory with no .yaml files fails."""
+        (tmp_path / "states.yaml").write_text("states: []")
+        (tmp_path / "rules.yaml").write_text("rules: []")
+        plans_dir = tmp_path / "plans"
+        plans_dir.mkdir()
+        (plans_dir / "notes.txt").write_text("not a plan")
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_policy_dir(tmp_path)
+        assert "No plan files" in str(exc_info.value)
 
     def test_missing_states_yaml(self, tmp_path):
         """Missing states.yaml fails."""
@@ -188,6 +227,15 @@ class TestValidateDeadline:
         """ISO datetime with offset passes."""
         assert validate_deadline_iso("2026-02-04T12:00:00-05:00") is True
 
+    def test_valid_iso_with_fraction(self):
+        """Fractional seconds and UTC designator pass."""
+        assert validate_deadline_iso("2026-02-04T12:00:00.123456Z") is True
+
+    def test_non_string_fails(self):
+        """Non-string input fails with a ValidationError."""
+        with pytest.raises(ValidationError):
+            validate_deadline_iso(None)
+
     def test_invalid_format(self):
         """Invalid format fails."""
         with pytest.raises(ValidationError) as exc_info:
@@ -209,3 +257,11 @@ class TestValidateEscalationState:
         with pytest.raises(ValidationError) as exc_info:
             validate_escalation_state("INVALID", valid_states)
         assert "Invalid escalation state" in str(exc_info.value)
+
+    def test_frozenset_states(self):
+        """Sets are accepted and error details list states in order."""
+        valid_states = frozenset(("OK", "REMIND_1", "FULL"))
+        assert validate_escalation_state("OK", valid_states) is True
+        with pytest.raises(ValidationError) as exc_info:
+            validate_escalation_state("PARTIAL", valid_states)
+        assert exc_info.value.details == {"valid_states": ["FULL", "OK", "REMIND_1"]}